@@ -0,0 +1,17 @@
+"""Filesystem locations of bundled builder assets."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=1)
+def assets_dir() -> Path:
+    """
+    Return the repository ``assets`` directory.
+
+    Page scripts are re-executed on every Streamlit rerun, so the path is resolved here, in an
+    imported module, where the cache survives reruns.
+    """
+    return Path(__file__).resolve().parents[3] / "assets"
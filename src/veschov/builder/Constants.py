@@ -3,6 +3,16 @@
 PUBLIC_BASE_URL: str = "https://veschov.streamlit.app/Builder"
 STATE_VERSION: int = 3
 LZMA_PREFIX: str = "x:"
+PRESET_DEFLATE_PREFIX: str = "p:"
+RAW_PREFIX: str = "r:"
+# Preset DEFLATE dictionary: the serialized empty build. Every share payload repeats these keys,
+# so priming the compressor with them leaves only the officer names and text to encode.
+# Never edit this value; payloads already shared with the "p:" prefix depend on it.
+STATE_DICTIONARY: bytes = (
+    '{"v":3,"holding":null,"bridge_slots":[null,null,null],'
+    '"even_slots":[null,null,null,null,null,null,null],"manual_pick":"\u2014",'
+    '"build_name":"","ship_name":"","notes":"","suggestions":[]}'
+).encode("utf-8")
 BRIDGE_SLOTS: int = 3
 EVEN_SLOTS: int = 7
 DEFAULT_SUGGESTIONS: list[str] = []  # OFFICER_NAMES[:8]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import base64
+import binascii
 import json
 import logging
 import lzma
@@ -19,13 +19,24 @@ from veschov.builder.Constants import (
     DEFAULT_SUGGESTIONS,
     EVEN_SLOTS,
     LZMA_PREFIX,
+    PRESET_DEFLATE_PREFIX,
     PUBLIC_BASE_URL,
+    RAW_PREFIX,
+    STATE_DICTIONARY,
     STATE_VERSION,
 )
-from veschov.builder.Serialization import _validate_slots
+from veschov.builder.Serialization import _validate_slots, rebuild_placed_officers
 
 logger = logging.getLogger(__name__)
 
+# json.dumps builds a fresh encoder whenever non-default options are passed; reuse one instead.
+_STATE_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+# Raw DEFLATE (negative wbits) drops the zlib header and checksum, saving 6 bytes per URL.
+_DEFLATE_WBITS = -zlib.MAX_WBITS
+# Translation tables between the standard and URL-safe base64 alphabets.
+_TO_URLSAFE = bytes.maketrans(b"+/", b"-_")
+_FROM_URLSAFE = bytes.maketrans(b"-_", b"+/")
+
 
 def copy_url_buttons() -> None:
     """Render the save/share UI for the builder state."""
@@ -158,8 +169,39 @@ def _coerce_state(payload: object) -> BuilderState | None:
     )
 
 
+def _state_fingerprint() -> tuple[object, ...]:
+    """Return a hashable snapshot of the session fields that serialize_state encodes."""
+    return (
+        STATE_VERSION,
+        st.session_state.holding,
+        tuple(st.session_state.bridge_slots),
+        tuple(st.session_state.even_slots),
+        st.session_state.manual_pick,
+        st.session_state.build_name,
+        st.session_state.ship_name,
+        st.session_state.notes,
+        tuple(st.session_state.suggestions),
+    )
+
+
 def serialize_state() -> str:
-    """Encode the current builder state into a shareable URL payload."""
+    """
+    Encode the current builder state into a shareable URL payload.
+
+    The last result is kept in session state with a fingerprint of its inputs, so saving again
+    without changes reuses it instead of re-encoding and recompressing.
+    """
+    fingerprint = _state_fingerprint()
+    cached = st.session_state.get("_last_serialized")
+    if cached is not None and cached[0] == fingerprint:
+        return cast(str, cached[1])
+    state = _encode_state()
+    st.session_state["_last_serialized"] = (fingerprint, state)
+    return state
+
+
+def _encode_state() -> str:
+    """Encode the current builder state without consulting the serialization cache."""
     payload: BuilderState = {
         "v": STATE_VERSION,
         "holding": cast(str | None, st.session_state.holding),
@@ -169,31 +211,73 @@ def serialize_state() -> str:
         "build_name": cast(str, st.session_state.build_name),
         "ship_name": cast(str, st.session_state.ship_name),
         "notes": cast(str, st.session_state.notes),
-        "suggestions": cast(list[str], st.session_state.suggestions),
+        "suggestions": list(cast(dict[str, None], st.session_state.suggestions)),
     }
-    encoded = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
-    compressed = lzma.compress(encoded, preset=9)
-    return f"{LZMA_PREFIX}{base64.urlsafe_b64encode(compressed).decode('ascii')}"
+    encoded = _STATE_ENCODER.encode(payload).encode("utf-8")
+    compressor = zlib.compressobj(
+        zlib.Z_BEST_COMPRESSION,
+        zlib.DEFLATED,
+        _DEFLATE_WBITS,
+        zdict=STATE_DICTIONARY,
+    )
+    compressed = compressor.compress(encoded) + compressor.flush()
+    if len(compressed) >= len(encoded):
+        # Compression can inflate short, name-dense payloads; ship the JSON as-is instead.
+        return f"{RAW_PREFIX}{_b64url_encode(encoded)}"
+    return f"{PRESET_DEFLATE_PREFIX}{_b64url_encode(compressed)}"
+
+
+def _b64url_encode(data: bytes) -> str:
+    """
+    Encode bytes as unpadded URL-safe base64.
+
+    Calls the binascii C routine directly instead of going through base64's wrappers. Trailing
+    ``=`` padding is dropped since it only lengthens URLs; _b64url_decode restores it.
+    """
+    encoded = binascii.b2a_base64(data, newline=False).translate(_TO_URLSAFE)
+    return encoded.rstrip(b"=").decode("ascii")
+
+
+def _b64url_decode(value: str) -> bytes:
+    """
+    Decode URL-safe base64, with or without padding.
+
+    binascii rejects unpadded input, so the missing ``=`` are appended to the translated bytes
+    (skipped when the length is already a multiple of four) rather than padding the str first.
+    """
+    data = value.encode("ascii").translate(_FROM_URLSAFE)
+    missing = -len(data) % 4
+    if missing:
+        data += b"=" * missing
+    return binascii.a2b_base64(data)
 
-def _pad_base64(value: str) -> str:
-    """Pad base64-encoded strings to valid lengths."""
-    return value + ("=" * (-len(value) % 4))
 
 def deserialize_state(encoded: str) -> BuilderState | None:
     """Decode and validate a shareable URL payload."""
     try:
         codec = "zlib"
         raw = encoded
-        if encoded.startswith(LZMA_PREFIX):
+        if encoded.startswith(RAW_PREFIX):
+            codec = "raw"
+            raw = encoded[len(RAW_PREFIX) :]
+        elif encoded.startswith(PRESET_DEFLATE_PREFIX):
+            codec = "preset-deflate"
+            raw = encoded[len(PRESET_DEFLATE_PREFIX) :]
+        elif encoded.startswith(LZMA_PREFIX):
             codec = "lzma"
             raw = encoded[len(LZMA_PREFIX) :]
 
-        padded = _pad_base64(raw)
-        compressed = base64.urlsafe_b64decode(padded.encode("ascii"))
-        if codec == "lzma":
-            decoded = lzma.decompress(compressed).decode("utf-8")
+        compressed = _b64url_decode(raw)
+        if codec == "raw":
+            decoded = compressed
+        elif codec == "preset-deflate":
+            decompressor = zlib.decompressobj(_DEFLATE_WBITS, zdict=STATE_DICTIONARY)
+            decoded = decompressor.decompress(compressed) + decompressor.flush()
+        elif codec == "lzma":
+            decoded = lzma.decompress(compressed)
         else:
-            decoded = zlib.decompress(compressed).decode("utf-8")
+            decoded = zlib.decompress(compressed)
+        # json.loads detects UTF-8 bytes itself, so no intermediate str decode is needed.
         payload = json.loads(decoded)
     except (ValueError, zlib.error) as exc:
         logger.warning("Failed to decode state payload: %s", exc)
@@ -241,5 +325,6 @@ def restore_state_from_query() -> None:
     st.session_state.build_name = restored["build_name"]
     st.session_state.ship_name = restored["ship_name"]
     st.session_state.notes = restored["notes"]
-    st.session_state.suggestions = restored["suggestions"]
+    st.session_state.suggestions = dict.fromkeys(restored["suggestions"])
+    rebuild_placed_officers()
     st.session_state.state_restored = True
@@ -13,12 +13,9 @@ def _validate_slots(values: object, expected_len: int) -> list[str | None] | Non
         return None
     if len(values) != expected_len:
         return None
-    for value in values:
-        if value is None:
-            continue
-        if not isinstance(value, str):
-            return None
-    return [cast(str | None, value) for value in values]
+    if not all(value is None or isinstance(value, str) for value in values):
+        return None
+    return cast(list[str | None], list(values))
 
 def init_state() -> None:
     """Initialize Streamlit session state with builder defaults."""
@@ -29,6 +26,24 @@ def init_state() -> None:
     st.session_state.setdefault("build_name", "")
     st.session_state.setdefault("ship_name", "")
     st.session_state.setdefault("notes", "")
-    st.session_state.setdefault("suggestions", DEFAULT_SUGGESTIONS.copy())
+    # An insertion-ordered dict doubles as an ordered set: O(1) add/remove without list copies.
+    st.session_state.setdefault("suggestions", dict.fromkeys(DEFAULT_SUGGESTIONS))
     st.session_state.setdefault("state_restored", False)
     st.session_state.setdefault("auto_seeded", False)
+    if "placed_officers" not in st.session_state:
+        rebuild_placed_officers()
+
+
+def rebuild_placed_officers() -> None:
+    """
+    Recompute ``placed_officers`` from the slot lists.
+
+    ``slot_click`` keeps the set current incrementally; call this after any bulk slot assignment
+    (URL restore, auto-seeding).
+    """
+    # Union the rows directly and drop the empty-slot marker once, rather than filtering a
+    # concatenated temporary list value by value.
+    placed: set[str | None] = set(st.session_state.bridge_slots)
+    placed.update(st.session_state.even_slots)
+    placed.discard(None)
+    st.session_state.placed_officers = placed
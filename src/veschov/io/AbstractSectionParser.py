@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
-from typing import IO, Any
+from typing import Iterator
 
+import numpy as np
 import pandas as pd
 
 from veschov.io.StartsWhen import NA_TOKENS as STARTSWHEN_NA_TOKENS
@@ -16,19 +18,8 @@ class AbstractSectionParser:
     """Provide shared parsing helpers for sectioned battle log exports."""
 
     NA_TOKENS = STARTSWHEN_NA_TOKENS
-
-    def _read_text(self, file_bytes: bytes | str | IO[Any]) -> str:
-        """Return a UTF-8 decoded string from a bytes, str, or file-like input."""
-        if isinstance(file_bytes, bytes):
-            return file_bytes.decode("utf-8", errors="replace")
-        if isinstance(file_bytes, str):
-            return file_bytes
-        if hasattr(file_bytes, "read"):
-            content = file_bytes.read()
-            if isinstance(content, bytes):
-                return content.decode("utf-8", errors="replace")
-            return str(content)
-        return str(file_bytes)
+    # Battle log exports write timestamps as e.g. "1/7/2026 8:20:49 AM".
+    TIMESTAMP_FORMAT = "%m/%d/%Y %I:%M:%S %p"
 
     def _normalize_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """Return a cleaned copy of the dataframe with trimmed strings and NA tokens."""
@@ -42,13 +33,38 @@ class AbstractSectionParser:
         return cleaned
 
     def _coerce_numeric_columns(self, df: pd.DataFrame, columns: tuple[str, ...]) -> pd.DataFrame:
-        """Return a copy of the dataframe with numeric columns coerced to numbers."""
+        """Return a copy of the dataframe with numeric columns coerced to plain float64."""
         updated = df.copy()
         for column in columns:
             if column not in updated.columns:
                 continue
             cleaned = updated[column].astype("string").str.replace(",", "", regex=False).str.strip()
-            updated[column] = pd.to_numeric(cleaned, errors="coerce")
+            # to_numeric on string dtype yields masked Float64/Int64; NaN-as-null float64 is far
+            # cheaper for the arithmetic in the damage derivation.
+            updated[column] = pd.to_numeric(cleaned, errors="coerce").astype("float64")
+        return updated
+
+    def _coerce_datetime_columns(
+        self, df: pd.DataFrame, columns: tuple[str, ...]
+    ) -> pd.DataFrame:
+        """Return a copy of the dataframe with timestamp strings parsed to datetime64[ns]."""
+        updated = df.copy()
+        for column in columns:
+            if column not in updated.columns:
+                continue
+            cleaned = updated[column].astype("string").str.strip()
+            # An explicit format keeps to_datetime vectorized; inferring it falls back to
+            # per-element dateutil parsing and warns on every call.
+            parsed = pd.to_datetime(cleaned, format=self.TIMESTAMP_FORMAT, errors="coerce")
+            unparsed = parsed.isna() & cleaned.notna()
+            if unparsed.any():
+                logger.warning(
+                    "Could not parse %s %s values as timestamps; e.g. %r.",
+                    int(unparsed.sum()),
+                    column,
+                    cleaned[unparsed].iloc[0],
+                )
+            updated[column] = parsed
         return updated
 
     def _coerce_yes_no_columns(self, df: pd.DataFrame, columns: tuple[str, ...]) -> pd.DataFrame:
@@ -62,10 +78,14 @@ class AbstractSectionParser:
         return updated
 
     def _numeric_series(self, df: pd.DataFrame, column: str) -> pd.Series:
-        """Return a numeric series for a column, defaulting to nullable floats."""
-        if column not in df.columns:
-            return pd.Series(pd.NA, index=df.index, dtype="Float64")
-        return pd.to_numeric(df[column], errors="coerce")
+        """Return a float64 series for a column, defaulting to NaN when the column is missing."""
+        series = df.get(column)
+        if series is None:
+            return pd.Series(np.nan, index=df.index, dtype="float64")
+        # Columns already coerced by _coerce_numeric_columns skip the to_numeric scan.
+        if pd.api.types.is_float_dtype(series) or pd.api.types.is_integer_dtype(series):
+            return series.astype("float64", copy=False)
+        return pd.to_numeric(series, errors="coerce").astype("float64", copy=False)
 
     def _fallback_players_df(
         self, combat_df: pd.DataFrame, npc_name: str | None
@@ -84,49 +104,70 @@ class AbstractSectionParser:
             )
             return pd.DataFrame(columns=["Player Name", "Ship Name"])
 
-        frames: list[pd.DataFrame] = []
-        for name_col, ship_col in (
-            ("attacker_name", "attacker_ship"),
-            ("target_name", "target_ship"),
-        ):
-            subset = (
-                combat_df.loc[:, [name_col, ship_col]]
-                .dropna(how="all")
-                .fillna("")
-                .astype(str)
-                .rename(columns={name_col: "Player Name", ship_col: "Ship Name"})
+        # dict.fromkeys gives an insertion-ordered dedupe of (name, ship) pairs in one pass.
+        pairs = dict.fromkeys(
+            itertools.chain.from_iterable(
+                self._name_ship_pairs(combat_df, name_col, ship_col)
+                for name_col, ship_col in (
+                    ("attacker_name", "attacker_ship"),
+                    ("target_name", "target_ship"),
+                )
             )
-            frames.append(subset)
-
-        combined = pd.concat(frames, ignore_index=True).drop_duplicates().reset_index(drop=True)
-        if npc_name:
-            combined = combined[combined["Player Name"].str.strip() != npc_name]
-        name_series = combined["Player Name"].fillna("").astype(str).str.strip()
-        ship_series = combined["Ship Name"].fillna("").astype(str).str.strip()
-        missing_name = (name_series == "") & (ship_series != "")
-        if missing_name.any():
+        )
+
+        first_ship_by_name: dict[str, str | None] = {}
+        duplicate_names: dict[str, None] = {}
+        missing_name_count = 0
+        for name, ship in pairs:
+            stripped_name = name.strip()
+            if npc_name and stripped_name == npc_name:
+                continue
+            if stripped_name == "":
+                if ship.strip() != "":
+                    missing_name_count += 1
+                continue
+            if name in first_ship_by_name:
+                duplicate_names[name] = None
+                if first_ship_by_name[name] is None and ship != "":
+                    first_ship_by_name[name] = ship
+                continue
+            first_ship_by_name[name] = ship or None
+
+        if missing_name_count:
             logger.warning(
                 "Dropping %s player rows with ship names but no player names.",
-                int(missing_name.sum()),
+                missing_name_count,
             )
-        combined = combined[name_series != ""]
-        if combined.empty:
+        if not first_ship_by_name:
             return pd.DataFrame(columns=["Player Name", "Ship Name"])
-
-        combined = combined.replace({"": pd.NA})
-        duplicate_players = combined["Player Name"].duplicated()
-        if duplicate_players.any():
+        if duplicate_names:
             logger.warning(
                 "Multiple ships found for players %s; keeping first ship name.",
-                ", ".join(combined.loc[duplicate_players, "Player Name"].unique()),
+                ", ".join(duplicate_names),
             )
 
-        deduped = (
-            combined.groupby("Player Name", sort=False)["Ship Name"]
-            .apply(lambda series: series.dropna().iloc[0] if not series.dropna().empty else pd.NA)
-            .reset_index()
+        return pd.DataFrame(
+            [
+                (name, pd.NA if ship is None else ship)
+                for name, ship in first_ship_by_name.items()
+            ],
+            columns=["Player Name", "Ship Name"],
+        )
+
+    @staticmethod
+    def _name_ship_pairs(
+        combat_df: pd.DataFrame, name_col: str, ship_col: str
+    ) -> Iterator[tuple[str, str]]:
+        """Yield distinct (name, ship) string pairs, skipping rows where both values are missing."""
+        # Dedupe in pandas first so only the handful of distinct pairs reach Python.
+        pairs = (
+            combat_df.loc[:, [name_col, ship_col]]
+            .dropna(how="all")
+            .drop_duplicates()
+            .fillna("")
+            .astype(str)
         )
-        return deduped.loc[:, ["Player Name", "Ship Name"]].reset_index(drop=True)
+        return zip(pairs[name_col].tolist(), pairs[ship_col].tolist())
 
     def _align_players_columns(self, source_df: pd.DataFrame, columns: pd.Index) -> pd.DataFrame:
         """Align inferred player data to the export metadata columns."""
@@ -4,14 +4,19 @@ from __future__ import annotations
 
 import io
 import logging
-from typing import IO, Any
 
 import pandas as pd
 
 from veschov.io.AbstractSectionParser import AbstractSectionParser
-from veschov.io.StartsWhen import StartsWhen, extract_sections
+from veschov.io.StartsWhen import extract_section_spans, find_line_start
 from veschov.io.columns import resolve_event_type
-from veschov.io.schemas import CombatSchema, normalize_dataframe_for_schema, validate_dataframe
+from veschov.io.schemas import (
+    CombatSchema,
+    normalize_dataframe_for_schema,
+    to_arrow_strings,
+    validate_dataframe,
+)
+from veschov.io.schemas.CombatSchema import COMBAT_STRING_COLUMNS
 from veschov.transforms.derive_metrics import add_shot_index
 
 logger = logging.getLogger(__name__)
@@ -43,30 +48,51 @@ class BattleSectionParser(AbstractSectionParser):
         "hull_damage",
     )
     COMBAT_BOOLEAN_COLUMNS = ("is_crit", "attacker_is_armada", "target_is_armada")
+    COMBAT_PREFIX = "Round\t"
 
-    def __init__(self, file_bytes: bytes | str | IO[Any]) -> None:
-        self.file_bytes = file_bytes
+    def __init__(self, text: str) -> None:
+        """Store the already-decoded battle log text (see ``read_text``)."""
+        self.text = text
 
     def parse(self, *, soft: bool = False) -> tuple[pd.DataFrame, pd.DataFrame]:
         """Return the validated combat dataframe plus a raw copy."""
-        text = self._read_text(self.file_bytes)
-        wrapped = StartsWhen(io.StringIO(text), "Round\t")
-        df = pd.read_csv(wrapped, sep="\t", dtype=str, na_values=self.NA_TOKENS)
-        raw_df = df.copy()
-        df = self._normalize_combat_df(df)
-        df = add_shot_index(df)
-        df = validate_dataframe(df, CombatSchema, soft=soft, context="combat section")
-        return df, raw_df
+        text = self.text
+        return self._parse_from(text, find_line_start(text, self.COMBAT_PREFIX), soft=soft)
 
     def parse_with_sections(
         self, *, soft: bool = False
     ) -> tuple[pd.DataFrame, pd.DataFrame, dict[str, str]]:
         """Return the validated combat dataframe, raw copy, and extracted sections."""
-        text = self._read_text(self.file_bytes)
-        sections = extract_sections(text)
-        df, raw_df = BattleSectionParser(text).parse(soft=soft)
+        text = self.text
+        spans = extract_section_spans(text)
+        sections = {key: text[start:end] for key, (start, end) in spans.items()}
+        combat_span = spans.get("combat")
+        combat_start = (
+            combat_span[0] if combat_span is not None else find_line_start(text, self.COMBAT_PREFIX)
+        )
+        df, raw_df = self._parse_from(text, combat_start, soft=soft)
         return df, raw_df, sections
 
+    def _parse_from(
+        self, text: str, combat_start: int | None, *, soft: bool
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Parse the combat rows from ``combat_start`` to the end of ``text``."""
+        if combat_start is None:
+            logger.warning("Combat header %r not found in battle log.", self.COMBAT_PREFIX)
+            combat_start = len(text)
+        df = pd.read_csv(
+            io.StringIO(text[combat_start:]),
+            sep="\t",
+            dtype=str,
+            na_values=self.NA_TOKENS,
+        )
+        raw_df = df.copy()
+        df = self._normalize_combat_df(df)
+        df = add_shot_index(df)
+        df = validate_dataframe(df, CombatSchema, soft=soft, context="combat section")
+        df = to_arrow_strings(df, COMBAT_STRING_COLUMNS)
+        return df, raw_df
+
     def _normalize_combat_df(self, df: pd.DataFrame) -> pd.DataFrame:
         cleaned = self._normalize_dataframe(df)
         cleaned = self._coerce_numeric_columns(cleaned, self.RAW_NUMERIC_COLUMNS)
@@ -6,7 +6,8 @@ import pandas as pd
 
 from veschov.io.AbstractSectionParser import AbstractSectionParser
 from veschov.io.StartsWhen import SECTION_HEADERS, section_to_dataframe
-from veschov.io.schemas import LootSchema, validate_dataframe
+from veschov.io.schemas import LootSchema, to_arrow_strings, validate_dataframe
+from veschov.io.schemas.LootSchema import LOOT_STRING_COLUMNS
 
 logger = logging.getLogger(__name__)
 
@@ -23,9 +24,10 @@ class LootSectionParser(AbstractSectionParser):
             logger.debug("Rewards section missing or empty; returning empty loot dataframe.")
         loot_df = section_to_dataframe(self.section_text, SECTION_HEADERS["rewards"])
         loot_df = self._normalize_dataframe(loot_df)
-        return validate_dataframe(
+        loot_df = validate_dataframe(
             loot_df,
             LootSchema,
             soft=soft,
             context="loot section",
         )
+        return to_arrow_strings(loot_df, LOOT_STRING_COLUMNS)
@@ -8,7 +8,8 @@ import pandas as pd
 
 from veschov.io.AbstractSectionParser import AbstractSectionParser
 from veschov.io.StartsWhen import SECTION_HEADERS, section_to_dataframe
-from veschov.io.schemas import PlayersSchema, validate_dataframe
+from veschov.io.schemas import PlayersSchema, to_arrow_strings, validate_dataframe
+from veschov.io.schemas.PlayersSchema import PLAYERS_STRING_COLUMNS
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,9 @@ logger = logging.getLogger(__name__)
 class PlayerSectionParser(AbstractSectionParser):
     """Parse and normalize the player metadata section of a battle log."""
 
+    PLAYER_NUMERIC_COLUMNS = ("Player Level",)
+    PLAYER_DATETIME_COLUMNS = ("Timestamp",)
+
     def __init__(self, section_text: str | None, combat_df: pd.DataFrame) -> None:
         self.section_text = section_text
         self.combat_df = combat_df
@@ -25,9 +29,12 @@ class PlayerSectionParser(AbstractSectionParser):
         players_df = section_to_dataframe(self.section_text, SECTION_HEADERS["players"])
         players_df = self._normalize_dataframe(players_df)
         players_df = self._augment_players_df(players_df, self.combat_df)
-        return validate_dataframe(
+        players_df = self._coerce_numeric_columns(players_df, self.PLAYER_NUMERIC_COLUMNS)
+        players_df = self._coerce_datetime_columns(players_df, self.PLAYER_DATETIME_COLUMNS)
+        players_df = validate_dataframe(
             players_df,
             PlayersSchema,
             soft=soft,
             context="player section",
         )
+        return to_arrow_strings(players_df, PLAYERS_STRING_COLUMNS)
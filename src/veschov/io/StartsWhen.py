@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import io
 import logging
-from typing import IO
+from typing import Iterator
 
 import pandas as pd
 
@@ -18,39 +18,81 @@ SECTION_HEADERS = {
 }
 
 
-def extract_sections(text: str, headers: dict[str, str] | None = None) -> dict[str, str]:
-    """Extract labeled sections from a battle log export."""
+def iter_line_spans(text: str) -> Iterator[tuple[int, int]]:
+    """
+    Yield ``(start, end)`` offsets for each line of ``text`` without copying it.
+
+    ``end`` excludes the line terminator (``\n`` or ``\r\n``).
+    """
+    length = len(text)
+    start = 0
+    while start < length:
+        newline = text.find("\n", start)
+        next_start = length if newline == -1 else newline + 1
+        end = length if newline == -1 else newline
+        if end > start and text[end - 1] == "\r":
+            end -= 1
+        yield start, end
+        start = next_start
+
+
+def extract_section_spans(
+    text: str, headers: dict[str, str] | None = None
+) -> dict[str, tuple[int, int]]:
+    """
+    Return ``{section: (start, end)}`` offsets of labeled sections in a single pass.
+
+    A section starts at a line beginning with its header prefix and ends at the next blank line,
+    the next header, or the end of the text.
+    """
     headers = headers or SECTION_HEADERS
-    found: dict[str, str] = {}
+    spans: dict[str, tuple[int, int]] = {}
     current_key: str | None = None
-    buffer: list[str] = []
+    section_start = 0
+    section_end = 0
 
-    for line in text.splitlines():
-        if line.strip() == "":
-            if current_key and buffer:
-                found[current_key] = "\n".join(buffer)
+    for line_start, line_end in iter_line_spans(text):
+        if text[line_start:line_end].strip() == "":
+            if current_key:
+                spans[current_key] = (section_start, section_end)
             current_key = None
-            buffer = []
             continue
 
         matched_key = next(
-            (key for key, prefix in headers.items() if line.startswith(prefix)),
+            (key for key, prefix in headers.items() if text.startswith(prefix, line_start)),
             None,
         )
         if matched_key:
-            if current_key and buffer:
-                found[current_key] = "\n".join(buffer)
+            if current_key:
+                spans[current_key] = (section_start, section_end)
             current_key = matched_key
-            buffer = [line]
+            section_start = line_start
+            section_end = line_end
             continue
 
         if current_key:
-            buffer.append(line)
+            section_end = line_end
+
+    if current_key:
+        spans[current_key] = (section_start, section_end)
 
-    if current_key and buffer:
-        found[current_key] = "\n".join(buffer)
+    return spans
 
-    return found
+
+def extract_sections(text: str, headers: dict[str, str] | None = None) -> dict[str, str]:
+    """Extract labeled sections from a battle log export."""
+    return {
+        key: text[start:end]
+        for key, (start, end) in extract_section_spans(text, headers).items()
+    }
+
+
+def find_line_start(text: str, prefix: str) -> int | None:
+    """Return the offset of the first line starting with ``prefix``, or None if absent."""
+    for line_start, _ in iter_line_spans(text):
+        if text.startswith(prefix, line_start):
+            return line_start
+    return None
 
 
 def section_to_dataframe(section_text: str | None, header_prefix: str) -> pd.DataFrame:
@@ -70,36 +112,3 @@ def section_to_dataframe(section_text: str | None, header_prefix: str) -> pd.Dat
         logger.exception("Failed to parse section with header %s", header_prefix)
         return pd.DataFrame(columns=columns)
 
-
-class StartsWhen(io.TextIOBase):
-    """Wrap a text stream so reads begin after a specific prefix line."""
-
-    def __init__(self, f: IO[str], prefix: str) -> None:
-        self._f = f
-        self._prefix = prefix
-        self._started = False
-
-    def readable(self) -> bool:
-        return True
-
-    def readline(self, size: int = -1) -> str:
-        if not self._started:
-            for line in self._f:
-                if line.startswith(self._prefix):
-                    self._started = True
-                    return line
-            return ""  # EOF
-        return self._f.readline(size)
-
-    def read(self, size: int = -1) -> str:
-        if not self._started:
-            # consume until we hit the prefix
-            first = self.readline()
-            if first == "":
-                return ""
-            if size == -1:
-                return first + self._f.read()
-            # bounded read: return first plus remaining up to size
-            rest = self._f.read(max(0, size - len(first)))
-            return first + rest
-        return self._f.read(size)
@@ -28,19 +28,3 @@ def resolve_event_type(
         return base.where(df[ability_type_column].isna(), df[ability_type_column])
     return base
 
-
-def add_alias_columns(
-    df: pd.DataFrame,
-    *,
-    aliases: dict[str, str] | None,
-) -> pd.DataFrame:
-    """Add alias columns for canonical sources (does not drop originals)."""
-    updated = df.copy()
-    updated.attrs = df.attrs.copy()
-    alias_map = aliases or {}
-    for alias, source in alias_map.items():
-        if alias in updated.columns:
-            continue
-        if source in updated.columns:
-            updated[alias] = updated[source]
-    return updated
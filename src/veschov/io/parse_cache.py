@@ -0,0 +1,105 @@
+"""On-disk Arrow cache for parsed battle logs, keyed by file content hash."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PARSE_CACHE_ENV_VAR = "VESCHOV_PARSE_CACHE_DIR"
+# Bump whenever parser output changes so stale cache entries are ignored.
+# 2: cache hits are re-coerced against the section schemas before use; also retires entries
+#    written before the Arrow string, Int16 Player Level, datetime Timestamp, and
+#    resolved-column changes to parser output.
+# 3: cache hits restore Arrow-backed string columns (combat, players, loot).
+PARSE_CACHE_FORMAT = "3"
+COMBAT_FILE_SUFFIX = "combat.feather"
+
+
+def parse_cache_dir() -> Path | None:
+    """
+    Return the parse cache directory, or None when caching is disabled.
+
+    The cache is opt-in: it is only used when ``VESCHOV_PARSE_CACHE_DIR`` names a directory.
+    Entries are never evicted, so it suits local batch work, not a server receiving uploads.
+    """
+    configured = os.environ.get(PARSE_CACHE_ENV_VAR, "").strip()
+    if not configured:
+        return None
+    return Path(configured).expanduser()
+
+
+def content_key(file_bytes: bytes) -> str:
+    """Return the cache key for a battle log's raw bytes."""
+    digest = hashlib.blake2b(file_bytes, digest_size=16)
+    digest.update(PARSE_CACHE_FORMAT.encode("ascii"))
+    return digest.hexdigest()
+
+
+def load_cached_parse(key: str) -> pd.DataFrame | None:
+    """Return the cached combat dataframe (with its attrs frames) for ``key``, if present."""
+    cache_dir = parse_cache_dir()
+    if cache_dir is None:
+        return None
+    combat_path = cache_dir / f"{key}.{COMBAT_FILE_SUFFIX}"
+    if not combat_path.exists():
+        logger.debug("Parse cache miss for %s.", key)
+        return None
+    try:
+        df = pd.read_feather(combat_path)
+        for attr_path in cache_dir.glob(f"{key}.attrs.*.feather"):
+            attr_name = attr_path.name.removeprefix(f"{key}.attrs.").removesuffix(".feather")
+            df.attrs[attr_name] = pd.read_feather(attr_path)
+    except Exception:
+        logger.warning("Failed to read parse cache entry %s; reparsing.", key, exc_info=True)
+        return None
+    logger.debug("Parse cache hit for %s.", key)
+    return df
+
+
+def store_cached_parse(key: str, df: pd.DataFrame) -> None:
+    """Write the combat dataframe and its dataframe attrs to the cache under ``key``."""
+    cache_dir = parse_cache_dir()
+    if cache_dir is None:
+        return
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for attr_name, value in df.attrs.items():
+            if attr_name.startswith("_"):
+                # Private bookkeeping (e.g. resolved actor columns) is tied to the live object.
+                continue
+            if not isinstance(value, pd.DataFrame):
+                logger.warning("Not caching non-dataframe attr %s for %s.", attr_name, key)
+                continue
+            _write_feather(value, cache_dir / f"{key}.attrs.{attr_name}.feather")
+        # The combat file is written last; its presence marks a complete entry.
+        _write_feather(df, cache_dir / f"{key}.{COMBAT_FILE_SUFFIX}")
+    except Exception:
+        logger.warning("Failed to write parse cache entry %s.", key, exc_info=True)
+
+
+def _write_feather(df: pd.DataFrame, path: Path) -> None:
+    """
+    Atomically write a dataframe to a feather file.
+
+    Each writer gets its own temp file, so concurrent parses of the same log (e.g. from
+    parse_battle_logs workers) cannot clobber each other's partial output.
+    """
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+    ) as handle:
+        tmp_path = Path(handle.name)
+    try:
+        frame = df.copy(deep=False)
+        frame.attrs = {}
+        frame.reset_index(drop=True).to_feather(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -3,25 +3,64 @@
 from __future__ import annotations
 
 import logging
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator
 
 import pandas as pd
+from pandera.api.pandas.model import DataFrameModel
 
 from veschov.io.BattleSectionParser import BattleSectionParser
 from veschov.io.FleetSectionParser import FleetSectionParser
 from veschov.io.LootSectionParser import LootSectionParser
 from veschov.io.PlayerSectionParser import PlayerSectionParser
+from veschov.io.parse_cache import content_key, load_cached_parse, store_cached_parse
+from veschov.io.schemas import (
+    CombatSchema,
+    FleetsSchema,
+    LootSchema,
+    PlayersSchema,
+    to_arrow_strings,
+    validate_dataframe,
+)
+from veschov.io.schemas.CombatSchema import COMBAT_STRING_COLUMNS
+from veschov.io.schemas.LootSchema import LOOT_STRING_COLUMNS
+from veschov.io.schemas.PlayersSchema import PLAYERS_STRING_COLUMNS
+from veschov.io.text_utils import read_text
+from veschov.transforms.columns import record_actor_columns
 
 logger = logging.getLogger(__name__)
 
+READ_WORKERS = 8
+# Logs read or parsed concurrently by parse_battle_logs; bounds bytes and frames held in memory.
+MAX_IN_FLIGHT = 64
+# Schema and Arrow string columns for each dataframe attr restored from the parse cache.
+CACHED_ATTR_SCHEMAS = {
+    "players_df": (PlayersSchema, PLAYERS_STRING_COLUMNS),
+    "fleets_df": (FleetsSchema, ()),
+    "loot_df": (LootSchema, LOOT_STRING_COLUMNS),
+}
+
 
 def parse_battle_log(file_bytes: bytes, filename: str) -> pd.DataFrame:
     """
     Should return a pandas DataFrame with at least:
       - 'mitigated_apex'
       - 'total_normal'
+
+    Results are cached on disk keyed by the file content hash (see ``parse_cache``).
     """
-    del filename
-    df, raw_df, sections = BattleSectionParser(file_bytes).parse_with_sections()
+    cache_key = content_key(file_bytes)
+    cached = load_cached_parse(cache_key)
+    if cached is not None:
+        restored = _restore_cached_parse(cached, filename)
+        if restored is not None:
+            logger.info("Loaded parsed battle log %s from cache.", filename)
+            record_actor_columns(restored)
+            return restored
+    text = read_text(file_bytes)
+    df, raw_df, sections = BattleSectionParser(text).parse_with_sections()
     validated_players_df = PlayerSectionParser(sections.get("players"), df).parse()
     validated_fleets_df = FleetSectionParser(sections.get("fleets")).parse()
     validated_loot_df = LootSectionParser(sections.get("rewards")).parse()
@@ -33,4 +72,93 @@ def parse_battle_log(file_bytes: bytes, filename: str) -> pd.DataFrame:
             "raw_combat_df": raw_df,
         }
     )
+    store_cached_parse(cache_key, df)
+    record_actor_columns(df)
     return df
+
+
+def _restore_cached_parse(cached: pd.DataFrame, filename: str) -> pd.DataFrame | None:
+    """
+    Re-apply schema coercion to a parse cache hit, or return None to force a reparse.
+
+    Feather files only round-trip Arrow types (Arrow-backed string columns come back as
+    object), so cached frames go through the same validate_dataframe and to_arrow_strings
+    steps as freshly parsed sections before anything downstream sees them.
+    """
+    try:
+        frames = {
+            name: _restore_section(cached.attrs[name], schema, string_columns, f"cached {name}")
+            for name, (schema, string_columns) in CACHED_ATTR_SCHEMAS.items()
+            if isinstance(cached.attrs.get(name), pd.DataFrame)
+        }
+        restored = _restore_section(
+            cached, CombatSchema, COMBAT_STRING_COLUMNS, "cached combat"
+        )
+    except Exception:
+        logger.warning(
+            "Cached parse of %s failed schema checks; reparsing.", filename, exc_info=True
+        )
+        return None
+    restored.attrs.update(frames)
+    return restored
+
+
+def _restore_section(
+    df: pd.DataFrame,
+    schema: type[DataFrameModel],
+    string_columns: tuple[str, ...],
+    context: str,
+) -> pd.DataFrame:
+    """Coerce one cached frame to its schema and restore its Arrow-backed string columns."""
+    validated = validate_dataframe(df, schema, soft=False, context=context)
+    if not string_columns:
+        return validated
+    return to_arrow_strings(validated, string_columns)
+
+
+def parse_battle_logs(
+    paths: Iterable[Path],
+    *,
+    max_workers: int | None = None,
+    max_in_flight: int = MAX_IN_FLIGHT,
+) -> Iterator[pd.DataFrame]:
+    """
+    Parse many battle logs, yielding dataframes in the same order as ``paths``.
+
+    File reads run on a small thread pool and each log is handed to a process pool once its
+    bytes arrive, so disk I/O overlaps with the CPU-bound pandas parsing. At most
+    ``max_in_flight`` logs are being read or parsed at any time, which bounds how many file
+    contents and results are held in memory. ``max_workers`` bounds the parser processes
+    (defaults to the CPU count).
+    """
+    if max_in_flight < 1:
+        raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}.")
+    path_list = list(paths)
+    if not path_list:
+        logger.warning("parse_battle_logs called with no paths; nothing to parse.")
+        return
+    path_iter = iter(path_list)
+    reads: deque[tuple[Future[bytes], Path]] = deque()
+    parses: deque[Future[pd.DataFrame]] = deque()
+    with (
+        ThreadPoolExecutor(max_workers=READ_WORKERS) as readers,
+        ProcessPoolExecutor(max_workers=max_workers) as parsers,
+    ):
+
+        def fill_window() -> None:
+            while len(reads) + len(parses) < max_in_flight:
+                path = next(path_iter, None)
+                if path is None:
+                    return
+                reads.append((readers.submit(path.read_bytes), path))
+
+        fill_window()
+        while reads or parses:
+            # Hand reads to the parser pool in order: block on the oldest read only when no
+            # parse is pending, otherwise just move along the reads that have already finished.
+            while reads and (not parses or reads[0][0].done()):
+                read, path = reads.popleft()
+                parses.append(parsers.submit(parse_battle_log, read.result(), path.name))
+            result = parses.popleft().result()
+            fill_window()
+            yield result
@@ -91,7 +91,7 @@ COMBAT_COLUMN_RENAMES: ClassVar[dict[str, str]] = {
 COMBAT_COLUMN_ALIASES: ClassVar[dict[str, str]] = {
     "damage_after_apex": "applied_damage",
 }
-COMBAT_COLUMN_ORDER: ClassVar[list[str]] = [
+COMBAT_COLUMN_ORDER: tuple[str, ...] = (
     "round",
     "battle_event",
     "event_type",
@@ -126,7 +126,23 @@ COMBAT_COLUMN_ORDER: ClassVar[list[str]] = [
     "ability_owner_name",
     "target_defeated",
     "target_destroyed",
-]
+)
+
+# Columns declared as Series[str]; stored as Arrow-backed strings after validation.
+COMBAT_STRING_COLUMNS: tuple[str, ...] = (
+    "event_type",
+    "attacker_name",
+    "attacker_ship",
+    "attacker_alliance",
+    "target_name",
+    "target_ship",
+    "target_alliance",
+    "ability_type",
+    "ability_name",
+    "ability_owner_name",
+    "target_defeated",
+    "target_destroyed",
+)
 
 # CombatSchema.COLUMN_RENAMES = COMBAT_COLUMN_RENAMES
 # CombatSchema.COLUMN_ALIASES = COMBAT_COLUMN_ALIASES
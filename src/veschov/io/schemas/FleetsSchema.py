@@ -1,20 +1,18 @@
 """Pandera schema for fleet metadata dataframes."""
 
 
-from typing import ClassVar
-
 import pandas as pd
 import pandera as pa
 from pandera.typing import Series
 
-COLUMN_ORDER: ClassVar[list[str]] = [
+COLUMN_ORDER: tuple[str, ...] = (
     "Fleet Type",
     "Attack",
     "Defense",
     "Health",
     "buff_applied",
     "debuff_applied",
-]
+)
 
 class FleetsSchema(pa.DataFrameModel):
     """Schema definition for fleet metadata rows."""
@@ -1,15 +1,16 @@
 """Pandera schema for loot/rewards dataframes."""
 
 
-from typing import ClassVar
-
 import pandera as pa
 from pandera.typing import Series
 
-COLUMN_ORDER: ClassVar[list[str]] = [
+COLUMN_ORDER: tuple[str, ...] = (
     "Reward Name",
     "Count",
-]
+)
+
+# Columns declared as Series[str]; stored as Arrow-backed strings after validation.
+LOOT_STRING_COLUMNS: tuple[str, ...] = ("Reward Name",)
 
 
 class LootSchema(pa.DataFrameModel):
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-from typing import ClassVar
-
+import pandas as pd
 import pandera as pa
 from pandera.typing import Series
 
-COLUMN_ORDER: ClassVar[list[str]] = [
+COLUMN_ORDER: tuple[str, ...] = (
     "Player Name",
     "Player Level",
     "Outcome",
@@ -15,18 +14,30 @@ COLUMN_ORDER: ClassVar[list[str]] = [
     "Alliance",
     "Location",
     "Timestamp",
-]
+)
+
+# Columns declared as Series[str]; stored as Arrow-backed strings after validation.
+PLAYERS_STRING_COLUMNS: tuple[str, ...] = (
+    "Player Name",
+    "Outcome",
+    "Ship Name",
+    "Alliance",
+    "Location",
+)
+
 
 class PlayersSchema(pa.DataFrameModel):
     """Schema definition for player metadata rows."""
 
     player_name: Series[str] = pa.Field(alias="Player Name", nullable=True)
-    player_level: Series[str] = pa.Field(alias="Player Level", nullable=True)
+    # Levels are small integers; nullable Int16 is a quarter the size of float64.
+    player_level: Series[pd.Int16Dtype] = pa.Field(alias="Player Level", nullable=True)
     outcome: Series[str] = pa.Field(alias="Outcome", nullable=True)
 
     ship_name: Series[str] = pa.Field(alias="Ship Name", nullable=True)
     location: Series[str] = pa.Field(alias="Location", nullable=True)
-    timestamp: Series[str] = pa.Field(alias="Timestamp", nullable=True)
+    # Parsed once at ingest so downstream code never re-parses the strings.
+    timestamp: Series[pd.Timestamp] = pa.Field(alias="Timestamp", nullable=True, coerce=True)
     alliance: Series[str] = pa.Field(alias="Alliance", nullable=True)
 
     class Config:
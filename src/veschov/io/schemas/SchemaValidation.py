@@ -1,6 +1,7 @@
 """Helpers for validating battle log dataframes against pandera schemas."""
 
 import logging
+import os
 from typing import Iterable, Type
 
 import pandas as pd
@@ -9,11 +10,66 @@ from pandera.api.pandas.model import DataFrameModel
 
 logger = logging.getLogger(__name__)
 
+SCHEMA_VALIDATION_ENV_VAR = "VESCHOV_VALIDATE_SCHEMAS"
+
+
+def schema_validation_enabled() -> bool:
+    """
+    Return True when full pandera validation should run on parsed dataframes.
+
+    Validation duplicates the coercion already performed by the section parsers and costs about
+    as much as parsing itself, so by default only dtype coercion is applied. Set
+    ``VESCHOV_VALIDATE_SCHEMAS=1`` (as the test suite does) to run the full checks.
+    """
+    return os.environ.get(SCHEMA_VALIDATION_ENV_VAR, "").strip().lower() in {"1", "true", "yes"}
+
+
+_COMPILED_SCHEMAS: dict[Type[DataFrameModel], pa.DataFrameSchema] = {}
+
+
+def register_compiled_schemas(*schemas: Type[DataFrameModel]) -> None:
+    """Compile pandera schema objects up front so no validation pays the reflection cost."""
+    for schema in schemas:
+        _COMPILED_SCHEMAS[schema] = schema.to_schema()
+
+
+def _compiled_schema(schema: Type[DataFrameModel]) -> pa.DataFrameSchema:
+    """Return the pandera schema object for a model class, built once per class."""
+    compiled = _COMPILED_SCHEMAS.get(schema)
+    if compiled is None:
+        logger.debug("Compiling unregistered pandera schema for %s.", schema.__name__)
+        compiled = schema.to_schema()
+        _COMPILED_SCHEMAS[schema] = compiled
+    return compiled
+
+
 def reorder_columns(df: pd.DataFrame, column_order: Iterable[str]) -> pd.DataFrame:
-    """Return a dataframe with columns ordered to match the provided list."""
-    ordered = [column for column in column_order if column in df.columns]
-    extras = [column for column in df.columns if column not in ordered]
-    return df.loc[:, ordered + extras]
+    """
+    Return a dataframe with columns ordered to match the provided list.
+
+    Columns not in ``column_order`` keep their relative order after the ordered ones. The input
+    is returned unchanged when it is already in that order. Columns are moved by position, so
+    frames with duplicate labels are reordered too (every column appears exactly once).
+    """
+    positions_by_label: dict[object, list[int]] = {}
+    for position, label in enumerate(df.columns):
+        positions_by_label.setdefault(label, []).append(position)
+    ordered = [
+        position
+        for column in dict.fromkeys(column_order)
+        for position in positions_by_label.get(column, ())
+    ]
+    ordered_set = set(ordered)
+    new_order = ordered + [
+        position for position in range(len(df.columns)) if position not in ordered_set
+    ]
+    if new_order == list(range(len(df.columns))):
+        return df
+    # take (unlike reindex) accepts duplicate labels and, unlike iloc, does not flag the
+    # result as a copy.
+    updated = df.take(new_order, axis=1)
+    updated.attrs = dict(df.attrs)
+    return updated
 
 
 def _add_missing_schema_columns(
@@ -22,31 +78,84 @@ def _add_missing_schema_columns(
     *,
     context: str,
 ) -> pd.DataFrame:
-    schema_obj = schema.to_schema()
-    updated = df.copy()
+    schema_obj = _compiled_schema(schema)
     missing_required = [
         name
         for name, column in schema_obj.columns.items()
-        if column.required and name not in updated.columns
+        if column.required and name not in df.columns
     ]
-    if missing_required:
-        logger.warning(
-            "Schema %s missing required columns %s; filling with NA values.",
-            context,
-            ", ".join(missing_required),
-        )
-    for column in missing_required:
-        updated[column] = pd.NA
-    return updated
+    if not missing_required:
+        return df
+    logger.warning(
+        "Schema %s missing required columns %s; filling with NA values.",
+        context,
+        ", ".join(missing_required),
+    )
+    # assign shares the existing blocks rather than deep-copying the frame.
+    return df.assign(**{column: pd.NA for column in missing_required})
 
 
-def _coerce_to_schema(df: pd.DataFrame, schema: Type[DataFrameModel]) -> pd.DataFrame:
-    schema_obj = schema.to_schema()
+def _dtype_matches(series: pd.Series, column: pa.Column) -> bool:
+    """
+    Return True when ``series`` already has the dtype declared for ``column``.
+
+    String columns also accept the Arrow-backed string dtype the parsers store, so they are not
+    coerced back. Everything else must match the declared pandas dtype exactly; pandera's own
+    ``check`` also accepts other datetime units and string NA semantics, which would leave
+    coerce-only frames with different dtypes than fully validated ones.
+    """
+    from veschov.io.schemas.schema_helpers import arrow_string_dtype
+
+    declared = column.dtype.type
+    if pd.api.types.is_string_dtype(declared) and series.dtype == arrow_string_dtype():
+        return True
     try:
-        return schema_obj.coerce_dtype(df)
-    except Exception:  # pragma: no cover - defensive guard
-        logger.exception("Schema coercion failed; returning uncoerced dataframe.")
+        return bool(series.dtype == declared)
+    except TypeError:
+        logger.debug("Cannot compare dtype %s with %s; treating as stale.", series.dtype, declared)
+        return False
+
+
+def _coerce_to_schema(df: pd.DataFrame, schema: Type[DataFrameModel]) -> pd.DataFrame:
+    """
+    Coerce only the columns whose dtype differs from the schema's declared dtype.
+
+    Columns are coerced one at a time; a column that fails is logged and left as it was, so
+    one bad column does not leave the rest of the frame uncoerced.
+    """
+    schema_obj = _compiled_schema(schema)
+    coerced: dict[str, pd.Series] = {}
+    for name, column in schema_obj.columns.items():
+        if name not in df.columns or _dtype_matches(df[name], column):
+            continue
+        try:
+            # Column.coerce_dtype is a no-op here: coerce is set on the schema Config, not on
+            # the columns, so coerce through the declared dtype directly.
+            coerced[name] = column.dtype.try_coerce(df[name])
+        except Exception:
+            logger.warning(
+                "Schema %s could not coerce column %s from %s to %s; leaving it unchanged.",
+                schema.__name__,
+                name,
+                df[name].dtype,
+                column.dtype,
+                exc_info=True,
+            )
+    if not coerced:
+        logger.debug("All %s columns already match schema dtypes.", schema.__name__)
         return df
+    return df.assign(**coerced)
+
+
+def _summarize_failure_cases(failure_cases: pd.DataFrame) -> str:
+    """Return a compact string of distinct pandera failure cases for logging."""
+    subset = [
+        column
+        for column in ("schema_context", "column", "check", "failure_case")
+        if column in failure_cases.columns
+    ]
+    distinct = failure_cases.drop_duplicates(subset=subset or None)
+    return distinct.to_string(index=False)
 
 
 def validate_dataframe(
@@ -56,20 +165,30 @@ def validate_dataframe(
     soft: bool,
     context: str,
 ) -> pd.DataFrame:
-    """Validate a dataframe and optionally soften errors with warnings/coercion."""
+    """
+    Validate a dataframe and optionally soften errors with warnings/coercion.
+
+    When schema validation is disabled (see ``schema_validation_enabled``) only the schema dtype
+    coercion is applied.
+    """
     from veschov.io.schemas.schema_helpers import normalize_dataframe_for_schema
 
     updated = _add_missing_schema_columns(df, schema, context=context)
-    try:
-        validated = schema.validate(updated, lazy=True)
-    except pa.errors.SchemaErrors as exc:
-        if not soft:
-            logger.error("Schema validation failed for %s.", context, exc_info=exc)
-            raise
-        logger.warning(
-            "Schema validation issues for %s; coercing in soft mode. Errors=%s",
-            context,
-            exc.failure_cases.to_string(index=False),
-        )
+    if not schema_validation_enabled():
+        logger.debug("Skipping pandera validation for %s; coercing dtypes only.", context)
         validated = _coerce_to_schema(updated, schema)
+    else:
+        try:
+            validated = schema.validate(updated, lazy=True)
+        except pa.errors.SchemaErrors as exc:
+            if not soft:
+                logger.error("Schema validation failed for %s.", context, exc_info=exc)
+                raise
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Schema validation issues for %s; coercing in soft mode. Errors=%s",
+                    context,
+                    _summarize_failure_cases(exc.failure_cases),
+                )
+            validated = _coerce_to_schema(updated, schema)
     return normalize_dataframe_for_schema(validated, schema)
@@ -6,8 +6,14 @@ from veschov.io.schemas.CombatSchema import CombatSchema
 from veschov.io.schemas.FleetsSchema import FleetsSchema
 from veschov.io.schemas.LootSchema import LootSchema
 from veschov.io.schemas.PlayersSchema import PlayersSchema
-from veschov.io.schemas.SchemaValidation import reorder_columns, validate_dataframe
-from veschov.io.schemas.schema_helpers import normalize_dataframe_for_schema
+from veschov.io.schemas.SchemaValidation import (
+    register_compiled_schemas,
+    reorder_columns,
+    validate_dataframe,
+)
+from veschov.io.schemas.schema_helpers import normalize_dataframe_for_schema, to_arrow_strings
+
+register_compiled_schemas(CombatSchema, FleetsSchema, LootSchema, PlayersSchema)
 
 __all__ = [
     "CombatSchema",
@@ -17,4 +23,5 @@ __all__ = [
     "reorder_columns",
     "validate_dataframe",
     "normalize_dataframe_for_schema",
+    "to_arrow_strings",
 ]
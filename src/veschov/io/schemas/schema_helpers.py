@@ -1,17 +1,24 @@
 """Schema-driven normalization helpers for battle log dataframes."""
 
 import importlib
+import logging
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterable, Mapping
 
+import numpy as np
 import pandas as pd
 from pandera.api.pandas.model import DataFrameModel
 
-from veschov.io.columns import add_alias_columns
 from veschov.io.schemas.SchemaValidation import reorder_columns
 
+logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=None)
 def _get_schema_metadata(
     schema: type[DataFrameModel],
-) -> tuple[dict[str, str], dict[str, str], list[str]]:
+) -> tuple[Mapping[str, str], Mapping[str, str], tuple[str, ...]]:
     """
     Look for module-level constants next to the schema class:
       <PREFIX>_COLUMN_RENAMES
@@ -19,30 +26,98 @@ def _get_schema_metadata(
       <PREFIX>_COLUMN_ORDER
     Where PREFIX is the schema class name uppercased (e.g., CombatSchema -> COMBAT).
     Falls back to empty values.
+
+    Resolved once per schema class; the results are read-only so the cached values cannot be
+    mutated by callers.
     """
     mod = importlib.import_module(schema.__module__)
     prefix = schema.__name__.removesuffix("Schema").upper()  # CombatSchema -> COMBAT
     renames = getattr(mod, f"{prefix}_COLUMN_RENAMES", {}) or {}
     aliases = getattr(mod, f"{prefix}_COLUMN_ALIASES", {}) or {}
     order = getattr(mod, f"{prefix}_COLUMN_ORDER", []) or []
-    return dict(renames), dict(aliases), list(order)
+    return MappingProxyType(dict(renames)), MappingProxyType(dict(aliases)), tuple(order)
+
 
 def normalize_dataframe_for_schema(
     df: pd.DataFrame,
     schema: type[DataFrameModel],
 ) -> pd.DataFrame:
-    """Apply schema column renames, aliases, and ordering."""
-    updated = df.copy()
-    updated.attrs = df.attrs.copy()
+    """
+    Apply schema column renames, aliases, and ordering.
 
+    Returns ``df`` itself when it already has the schema's column names, aliases, and order;
+    otherwise returns a new frame, built with one column take, with ``df.attrs`` carried over.
+    """
     column_renames, column_aliases, column_order = _get_schema_metadata(schema)
+    pending_renames = {
+        source: target for source, target in column_renames.items() if source in df.columns
+    }
+    renamed_columns = {pending_renames.get(column, column) for column in df.columns}
+    pending_aliases = {
+        alias: source
+        for alias, source in column_aliases.items()
+        if alias not in renamed_columns and source in renamed_columns
+    }
 
-    if column_renames:
-        updated = updated.rename(columns=column_renames, inplace=False)
+    if not pending_renames and not pending_aliases:
+        # reorder_columns returns df itself when the order already matches.
+        return reorder_columns(df, column_order) if column_order else df
 
-    updated = add_alias_columns(updated, aliases=column_aliases or None)
+    # Fuse rename, alias, and reorder into a single positional take: work out each output
+    # column's label and source position first, then build the frame once.
+    labels = [pending_renames.get(column, column) for column in df.columns]
+    positions = list(range(len(labels)))
+    first_position: dict[str, int] = {}
+    for position, label in enumerate(labels):
+        first_position.setdefault(label, position)
+    for alias, source in pending_aliases.items():
+        labels.append(alias)
+        positions.append(first_position[source])
 
+    output_slots = list(range(len(labels)))
     if column_order:
-        updated = reorder_columns(updated, column_order)
+        slots_by_label: dict[str, list[int]] = {}
+        for slot, label in enumerate(labels):
+            slots_by_label.setdefault(label, []).append(slot)
+        ordered_labels = [label for label in column_order if label in slots_by_label]
+        ordered_set = set(ordered_labels)
+        output_slots = [slot for label in ordered_labels for slot in slots_by_label[label]]
+        output_slots.extend(slot for slot, label in enumerate(labels) if label not in ordered_set)
 
+    # take (unlike iloc) does not flag the result as a copy, so callers can assign columns.
+    updated = df.take([positions[slot] for slot in output_slots], axis=1)
+    updated.columns = [labels[slot] for slot in output_slots]
+    updated.attrs = dict(df.attrs)
     return updated
+
+
+@lru_cache(maxsize=1)
+def arrow_string_dtype() -> pd.StringDtype | None:
+    """
+    Return the Arrow-backed string dtype with NaN missing values, or None without pyarrow.
+
+    NaN semantics keep comparisons returning plain numpy booleans (as object strings do), so
+    existing boolean masks keep working while values live in one contiguous UTF-8 buffer.
+    """
+    try:
+        try:
+            return pd.StringDtype("pyarrow", na_value=np.nan)
+        except TypeError:  # pandas < 2.3 spells this storage "pyarrow_numpy"
+            return pd.StringDtype("pyarrow_numpy")
+    except ImportError:
+        logger.warning("pyarrow unavailable; keeping string columns as object dtype.")
+        return None
+
+
+def to_arrow_strings(df: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
+    """Return ``df`` with the given string columns converted to Arrow-backed strings."""
+    dtype = arrow_string_dtype()
+    if dtype is None:
+        return df
+    present = {column: dtype for column in columns if column in df.columns}
+    if not present:
+        logger.warning("No string columns found to convert to Arrow-backed strings.")
+        return df
+    # Convert per column: DataFrame.astype with a mapping concatenates the columns, and
+    # concat's attrs check raises on frames whose attrs hold dataframes (the parser output).
+    return df.assign(**{column: df[column].astype(dtype) for column in present})
@@ -0,0 +1,27 @@
+"""Text decoding helpers shared by the battle log parsers."""
+
+from __future__ import annotations
+
+import logging
+from typing import IO, Any
+
+logger = logging.getLogger(__name__)
+
+
+def read_text(file_bytes: bytes | str | IO[Any]) -> str:
+    """
+    Return a UTF-8 decoded string from a bytes, str, or file-like input.
+
+    Call this once per log and share the text with every section parser.
+    """
+    if isinstance(file_bytes, bytes):
+        return file_bytes.decode("utf-8", errors="replace")
+    if isinstance(file_bytes, str):
+        return file_bytes
+    if hasattr(file_bytes, "read"):
+        content = file_bytes.read()
+        if isinstance(content, bytes):
+            return content.decode("utf-8", errors="replace")
+        return str(content)
+    logger.warning("Unexpected battle log input type %s; using str().", type(file_bytes).__name__)
+    return str(file_bytes)
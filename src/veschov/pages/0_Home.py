@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import base64
-import hashlib
 import logging
+import os
 import random
+from functools import lru_cache
 from pathlib import Path
 
 import pandas as pd
@@ -12,11 +13,14 @@ import streamlit as st
 from veschov.io.SessionInfo import SessionInfo
 from veschov.io.parser_stub import parse_battle_log
 from veschov.ui.chirality import Lens
+from veschov.ui.components.combat_log_upload import compute_upload_hash
 from veschov.ui.object_reports.AbstractReport import AbstractReport
 from veschov.ui.pretty_stats.Statistic import Statistic
 
 logger = logging.getLogger(__name__)
 
+SAMPLE_LOG_SUFFIXES = frozenset({".csv", ".tsv", ".txt"})
+
 
 class HomeReport(AbstractReport):
     """Render the home page content and preload a sample log."""
@@ -89,7 +93,14 @@ it together."</strong>
             logger.warning("Home page image missing at %s.", path)
             st.warning("Home page image not found.")
             return None
-        data = path.read_bytes()
+        return self._encode_png_data_uri(str(path), path.stat().st_mtime)
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _encode_png_data_uri(path_str: str, mtime: float) -> str:
+        """Read and base64-encode a PNG once per (path, mtime) rather than on every rerun."""
+        del mtime  # cache key only; a changed file gets a fresh entry
+        data = Path(path_str).read_bytes()
         b64 = base64.b64encode(data).decode("utf-8")
         return f"data:image/png;base64,{b64}"
 
@@ -101,11 +112,7 @@ it together."</strong>
         if not log_dir.exists():
             logger.warning("Sample log directory not found at %s.", log_dir)
             return
-        candidates = [
-            path
-            for path in log_dir.iterdir()
-            if path.is_file() and path.suffix.lower() in {".csv", ".tsv", ".txt"}
-        ]
+        candidates = self._sample_log_candidates(str(log_dir))
         if not candidates:
             logger.warning("No sample logs found in %s.", log_dir)
             return
@@ -119,7 +126,7 @@ it together."</strong>
             st.warning(f"Unable to load sample log: {sample.name}.")
             return
 
-        upload_hash = hashlib.md5(data).hexdigest()
+        upload_hash = compute_upload_hash(data)
         st.session_state["battle_df"] = df
         st.session_state["battle_filename"] = sample.name
         st.session_state["battle_upload_hash"] = upload_hash
@@ -128,6 +135,19 @@ it together."</strong>
         st.session_state["session_info"] = SessionInfo(df)
         st.caption(f"Loaded sample log: {sample.name}")
 
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _sample_log_candidates(log_dir_str: str) -> tuple[Path, ...]:
+        """Return the sample log files in a directory, scanned once per process."""
+        # DirEntry.is_file() reuses the type info from readdir instead of a stat per entry.
+        with os.scandir(log_dir_str) as entries:
+            return tuple(
+                Path(entry.path)
+                for entry in entries
+                if entry.is_file()
+                and os.path.splitext(entry.name)[1].lower() in SAMPLE_LOG_SUFFIXES
+            )
+
     def get_under_title_text(self) -> str | None:
         return None
 
@@ -7,9 +7,10 @@ from typing import Callable, Iterable, TypedDict, cast
 
 import streamlit as st
 
+from veschov.builder.Assets import assets_dir
 from veschov.builder.Constants import EVEN_SLOTS, BRIDGE_SLOTS
 from veschov.builder.CopyUrlButtons import _get_state_query_param, restore_state_from_query, copy_url_buttons
-from veschov.builder.Serialization import init_state
+from veschov.builder.Serialization import init_state, rebuild_placed_officers
 from veschov.io.SessionInfo import SessionInfo
 from veschov.io.ShipSpecifier import ShipSpecifier
 
@@ -20,70 +21,82 @@ class OfficerNameRecord(TypedDict):
     key: str
     text: str
 
-ASSETS_DIR = Path(__file__).resolve().parents[3] / "assets"
+BRIDGE_LABEL_HTML: tuple[str, ...] = tuple(
+    f"<div style='text-align:center; font-size:0.85rem; opacity:0.8;'>{label}</div>"
+    for label in ("#1", "Capt.", "#2")
+)
 
 
-def load_officer_names(path: Path) -> list[str]:
-    """Load officer names from the JSON asset and return sorted text values."""
-    records = cast(list[OfficerNameRecord], json.loads(path.read_text(encoding="utf-8")))
+@st.cache_data(show_spinner=False)
+def load_officer_names(path: str) -> list[str]:
+    """
+    Load officer names from the JSON asset and return sorted text values.
+
+    The asset is treated as immutable at runtime, so it is read once per process rather than on
+    every script rerun.
+    """
+    # json.loads accepts UTF-8 bytes directly, skipping an intermediate str decode.
+    records = cast(list[OfficerNameRecord], json.loads(Path(path).read_bytes()))
     names = [record["text"] for record in records]
     return sorted(names)
 
 
-OFFICER_NAMES = load_officer_names(ASSETS_DIR / "officer_names.json")
+OFFICER_NAMES = load_officer_names(str(assets_dir() / "officer_names.json"))
 
 def pick(value: str) -> None:
     """Store the selected officer in the holding slot."""
     st.session_state.holding = value
 
 
-def all_placed_values() -> set[str]:
-    """Return a set of all officers currently placed in slots."""
-    placed: set[str] = set()
-    for value in st.session_state.bridge_slots + st.session_state.even_slots:
-        if value is not None:
-            placed.add(value)
-    return placed
-
-
 def remove_value_everywhere(value: str) -> None:
-    """Remove a value from all slot lists."""
+    """
+    Remove a value from all slot lists, in place, and from the placed-officer set.
+
+    Every slot is checked: URL restore and auto-seeding do not dedupe, so an officer can
+    occupy more than one slot.
+    """
     for key in ("bridge_slots", "even_slots"):
-        slots = [v if v != value else None for v in st.session_state[key]]
-        st.session_state[key] = slots
+        slots = st.session_state[key]
+        for position, slot in enumerate(slots):
+            if slot == value:
+                slots[position] = None
+    st.session_state.placed_officers.discard(value)
 
 
 def add_suggestion(value: str) -> None:
     """Append a value to suggestions if it is not already present."""
-    if value not in st.session_state.suggestions:
-        st.session_state.suggestions = st.session_state.suggestions + [value]
+    # suggestions is an insertion-ordered dict used as an ordered set.
+    st.session_state.suggestions.setdefault(value, None)
 
 
 def remove_suggestion(value: str) -> None:
     """Remove a value from suggestions if it exists."""
-    if value in st.session_state.suggestions:
-        st.session_state.suggestions = [
-            suggestion for suggestion in st.session_state.suggestions if suggestion != value
-        ]
+    st.session_state.suggestions.pop(value, None)
 
 
 def slot_click(row_key: str, idx: int) -> None:
     """Handle clicking a slot, placing or removing officers."""
     holding = st.session_state.holding
-    row = list(st.session_state[row_key])
+    # Rows are mutated in place; the session state already holds this list object.
+    row = st.session_state[row_key]
+
+    placed = cast(set[str], st.session_state.placed_officers)
 
     if holding is None:
         if row[idx] is not None:
             removed = row[idx]
             row[idx] = None
-            st.session_state[row_key] = row
+            placed.discard(removed)
             add_suggestion(removed)
         return
 
     # Dedupe, place, then drop.
     remove_value_everywhere(holding)
+    displaced = row[idx]
+    if displaced is not None:
+        placed.discard(displaced)
     row[idx] = holding
-    st.session_state[row_key] = row
+    placed.add(holding)
     st.session_state.holding = None
     st.session_state.manual_pick = "—"
     remove_suggestion(holding)
@@ -117,11 +130,13 @@ def render_wrapped_chips(
         st.caption("—")
         return
 
-    for r in range(0, len(pairs), per_row):
-        row = pairs[r : r + per_row]
-        cols = st.columns(len(row))
-        for i, (label, value) in enumerate(row):
-            cols[i].button(label, key=f"{key_prefix}_{r+i}", on_click=pick, args=(value,))
+    # One column set for the whole grid; chip n lands in column n % per_row, so rows line up
+    # without creating a new set of column containers per row.
+    cols = st.columns(per_row)
+    for index, (label, value) in enumerate(pairs):
+        cols[index % per_row].button(
+            label, key=f"{key_prefix}_{index}", on_click=pick, args=(value,)
+        )
 
 
 def on_manual_pick_change() -> None:
@@ -133,8 +148,17 @@ def on_manual_pick_change() -> None:
 
 def _normalize_names(values: Iterable[str]) -> list[str]:
     """Return sorted, deduplicated officer names from a raw iterable."""
-    normalized = {value.strip() for value in values if value and value.strip()}
-    return sorted(normalized)
+    seen: set[str] = set()
+    normalized: list[str] = []
+    for value in values:
+        if not value:
+            continue
+        stripped = value.strip()  # strip once per value, not once to test and once to keep
+        if stripped and stripped not in seen:
+            seen.add(stripped)
+            normalized.append(stripped)
+    normalized.sort()
+    return normalized
 
 
 def _pick_single_name(values: Iterable[str], label: str) -> str | None:
@@ -157,9 +181,46 @@ def _player_specs(session_info: SessionInfo) -> list[ShipSpecifier]:
     return sorted(specs, key=lambda spec: (spec.name or "", spec.ship or "", spec.alliance or ""))
 
 
+@st.cache_data(show_spinner=False)
+def _cached_player_specs(
+    session_info_fingerprint: str,
+    _session_info: SessionInfo,
+) -> list[ShipSpecifier]:
+    """Cached _player_specs, keyed by the uploaded log's content hash."""
+    return _player_specs(_session_info)
+
+
 def _set_suggestions(values: Iterable[str]) -> None:
     """Set suggestions to the provided officer names."""
-    st.session_state.suggestions = _normalize_names(values)
+    st.session_state.suggestions = dict.fromkeys(_normalize_names(values))
+
+
+def _combined_officers(
+    spec_keys: tuple[tuple[str | None, str | None], ...],
+    session_info: SessionInfo,
+) -> list[str]:
+    """Return the sorted union of officer names activated by each (player, ship) pair."""
+    combined_officers: set[str] = set()
+    for name, ship in spec_keys:
+        if not name or not ship:
+            logger.warning("Player spec missing name or ship; skipping %s/%s.", name, ship)
+            continue
+        combined_officers.update(session_info.all_officer_names(name, ship))
+    return _normalize_names(combined_officers)
+
+
+@st.cache_data(show_spinner=False)
+def _compute_combined_officers(
+    session_info_fingerprint: str,
+    spec_keys: tuple[tuple[str | None, str | None], ...],
+    _session_info: SessionInfo,
+) -> list[str]:
+    """
+    Cached _combined_officers, keyed by the uploaded log's content hash and the specs.
+
+    The session info itself is not hashed (leading underscore); the upload hash identifies it.
+    """
+    return _combined_officers(spec_keys, _session_info)
 
 
 def _auto_seed_from_session() -> None:
@@ -174,7 +235,15 @@ def _auto_seed_from_session() -> None:
     if not isinstance(session_info, SessionInfo):
         return
 
-    player_specs = _player_specs(session_info)
+    upload_hash = st.session_state.get("battle_upload_hash")
+    if not isinstance(upload_hash, str):
+        logger.warning("No upload hash for session info; seeding the builder uncached.")
+        upload_hash = None
+
+    if upload_hash is None:
+        player_specs = _player_specs(session_info)
+    else:
+        player_specs = _cached_player_specs(upload_hash, session_info)
     if len(player_specs) == 1:
         spec = player_specs[0]
         if not spec.name or not spec.ship:
@@ -220,16 +289,17 @@ def _auto_seed_from_session() -> None:
                     break
                 even_slots[index] = officer
             st.session_state.even_slots = even_slots
+            rebuild_placed_officers()
         else:
             _set_suggestions(session_info.all_officer_names(spec.name, spec.ship))
     elif len(player_specs) > 1:
-        combined_officers: set[str] = set()
-        for spec in player_specs:
-            if not spec.name or not spec.ship:
-                logger.warning("Player spec missing name or ship; skipping %s.", spec)
-                continue
-            combined_officers.update(session_info.all_officer_names(spec.name, spec.ship))
-        _set_suggestions(combined_officers)
+        spec_keys = tuple((spec.name, spec.ship) for spec in player_specs)
+        if upload_hash is None:
+            combined_officers = _combined_officers(spec_keys, session_info)
+        else:
+            combined_officers = _compute_combined_officers(upload_hash, spec_keys, session_info)
+        # Already stripped, deduplicated, and sorted; skip _set_suggestions' second pass.
+        st.session_state.suggestions = dict.fromkeys(combined_officers)
 
     st.session_state.auto_seeded = True
 
@@ -240,42 +310,53 @@ _auto_seed_from_session()
 
 st.title("Builder")
 
-# --- Holding text ---
-holding = st.session_state.holding
-if holding is None:
-    st.markdown("**Click an officer to crew.**")
-else:
-    st.markdown(f"**Click a position for `{holding}`, or click another officer.**")
 
+def render_bridge_label(col: st.delta_generator.DeltaGenerator, i: int) -> None:
+    """Render the position label above bridge slot ``i``."""
+    col.container().markdown(BRIDGE_LABEL_HTML[i], unsafe_allow_html=True)
 
-# Above columns
-# st.divider()
-copy_url_buttons()
 
-crew_col, notes_col = st.columns([3, 2])
+def render_bridge_slot(col: st.delta_generator.DeltaGenerator, i: int) -> None:
+    """Render bridge slot ``i`` as a button."""
+    val = st.session_state.bridge_slots[i]
+    label = val if val is not None else "—"
+    col.button(
+        label,
+        key=f"bridge_{i}",
+        on_click=slot_click,
+        args=("bridge_slots", i),
+    )
 
-with crew_col:
-    # --- BRIDGE with labels above slots ---
-    st.subheader("Bridge", text_alignment="center")
 
-    def render_bridge_label(col: st.delta_generator.DeltaGenerator, i: int) -> None:
-        labels = ["#1", "Capt.", "#2"]
-        container = col.container()
-        container.markdown(
-            f"<div style='text-align:center; font-size:0.85rem; opacity:0.8;'>{labels[i]}</div>",
-            unsafe_allow_html=True,
-        )
+def render_below_decks_slot(col: st.delta_generator.DeltaGenerator, i: int) -> None:
+    """Render below-deck slot ``i`` as a button."""
+    val = st.session_state.even_slots[i]
+    label = val if val is not None else "—"
+    col.button(
+        label,
+        key=f"even_{i}",
+        on_click=slot_click,
+        args=("even_slots", i),
+    )
 
-    def render_bridge_slot(col: st.delta_generator.DeltaGenerator, i: int) -> None:
-        val = st.session_state.bridge_slots[i]
-        label = val if val is not None else "—"
-        col.button(
-            label,
-            key=f"bridge_{i}",
-            on_click=slot_click,
-            args=("bridge_slots", i),
-        )
 
+@st.fragment
+def _render_crew_region() -> None:
+    """
+    Render the holding prompt, slot grids, manual pick, and suggestions.
+
+    Slot and chip clicks only rerun this fragment, not the whole page (state restore, seeding,
+    share form, notes). The holding prompt lives here so it stays in sync with those clicks.
+    """
+    # --- Holding text ---
+    holding = st.session_state.holding
+    if holding is None:
+        st.markdown("**Click an officer to crew.**")
+    else:
+        st.markdown(f"**Click a position for `{holding}`, or click another officer.**")
+
+    # --- BRIDGE with labels above slots ---
+    st.subheader("Bridge", text_alignment="center")
     centered_row(BRIDGE_SLOTS, render_bridge_label)
     centered_row(BRIDGE_SLOTS, render_bridge_slot)
 
@@ -283,17 +364,6 @@ with crew_col:
 
     # --- EVENS (10 slots) ---
     st.subheader("Below-Deck", text_alignment="center")
-
-    def render_below_decks_slot(col: st.delta_generator.DeltaGenerator, i: int) -> None:
-        val = st.session_state.even_slots[i]
-        label = val if val is not None else "—"
-        col.button(
-            label,
-            key=f"even_{i}",
-            on_click=slot_click,
-            args=("even_slots", i),
-        )
-
     centered_row(EVEN_SLOTS, render_below_decks_slot)
 
     st.divider()
@@ -314,7 +384,7 @@ with crew_col:
     with right:
         st.subheader("Suggestions")
 
-        placed = all_placed_values()
+        placed = cast(set[str], st.session_state.placed_officers)
         filtered = [
             (value, value)
             for value in st.session_state.suggestions
@@ -324,7 +394,10 @@ with crew_col:
         st.caption("Click a suggestion to hold it; it disappears once placed.")
         render_wrapped_chips(filtered, per_row=4, key_prefix="sugg")
 
-with notes_col:
+
+@st.fragment
+def _render_notes_region() -> None:
+    """Render the build name, ship name, and notes inputs; edits rerun only this fragment."""
     st.text_input("Build Name", key="build_name")
     st.text_input("Ship Name", key="ship_name")
     st.subheader("Notes")
@@ -335,4 +408,17 @@ with notes_col:
         help="Freeform notes for this crew layout.",
     )
 
+
+# Above columns
+# st.divider()
+copy_url_buttons()
+
+crew_col, notes_col = st.columns([3, 2])
+
+with crew_col:
+    _render_crew_region()
+
+with notes_col:
+    _render_notes_region()
+
 st.caption("Tip: click a filled slot with nothing held to clear it (suggestions will reappear).")
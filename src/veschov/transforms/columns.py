@@ -8,6 +8,16 @@ import pandas as pd
 
 ATTACKER_COLUMN_CANDIDATES = ("attacker_name", "Attacker")
 TARGET_COLUMN_CANDIDATES = ("target_name", "Target", "Defender Name")
+# df.attrs key holding the (attacker, target) names resolved when the log was parsed.
+RESOLVED_COLUMNS_ATTR = "_resolved_columns"
+
+# Every attacker/target alias mapped to (role, priority), so both columns resolve in one scan.
+_ATTACKER_ROLE = 0
+_TARGET_ROLE = 1
+_ALIAS_TO_ROLE: dict[str, tuple[int, int]] = {
+    **{alias: (_ATTACKER_ROLE, rank) for rank, alias in enumerate(ATTACKER_COLUMN_CANDIDATES)},
+    **{alias: (_TARGET_ROLE, rank) for rank, alias in enumerate(TARGET_COLUMN_CANDIDATES)},
+}
 
 
 def resolve_column(df: pd.DataFrame, candidates: Iterable[str]) -> str | None:
@@ -15,6 +25,46 @@ def resolve_column(df: pd.DataFrame, candidates: Iterable[str]) -> str | None:
     return next((candidate for candidate in candidates if candidate in df.columns), None)
 
 
+def resolve_actor_columns(df: pd.DataFrame) -> tuple[str | None, str | None]:
+    """
+    Return the ``(attacker, target)`` column names, honouring candidate order for each.
+
+    Frames derived from a parsed log carry the parse-time resolution in ``df.attrs``; it is
+    reused when both names are still present. Otherwise the columns are scanned.
+    """
+    recorded = df.attrs.get(RESOLVED_COLUMNS_ATTR)
+    if recorded is not None:
+        attacker_column, target_column = recorded
+        if attacker_column in df.columns and target_column in df.columns:
+            return attacker_column, target_column
+    return _scan_actor_columns(df)
+
+
+def record_actor_columns(df: pd.DataFrame) -> None:
+    """Store the resolved attacker/target column names on ``df.attrs`` for later lookups."""
+    df.attrs[RESOLVED_COLUMNS_ATTR] = _scan_actor_columns(df)
+
+
+def _scan_actor_columns(df: pd.DataFrame) -> tuple[str | None, str | None]:
+    """
+    Resolve both actor columns in one pass over ``df.columns``.
+
+    Equivalent to calling resolve_column with both candidate tuples, but each column name is
+    checked once against a prebuilt alias map.
+    """
+    resolved: list[str | None] = [None, None]
+    ranks = [len(ATTACKER_COLUMN_CANDIDATES), len(TARGET_COLUMN_CANDIDATES)]
+    for column in df.columns:
+        match = _ALIAS_TO_ROLE.get(column)
+        if match is None:
+            continue
+        role, rank = match
+        if rank < ranks[role]:
+            ranks[role] = rank
+            resolved[role] = column
+    return resolved[_ATTACKER_ROLE], resolved[_TARGET_ROLE]
+
+
 def get_series(df: pd.DataFrame, column: str) -> pd.Series:
     """Return a column series or an NA-filled placeholder for missing columns."""
     if column in df.columns:
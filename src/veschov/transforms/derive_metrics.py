@@ -6,48 +6,94 @@ import numpy as np
 import pandas as pd
 
 from veschov.transforms.columns import (
-    ATTACKER_COLUMN_CANDIDATES,
-    TARGET_COLUMN_CANDIDATES,
     get_series,
-    resolve_column,
+    resolve_actor_columns,
 )
 from veschov.utils.series import coerce_numeric
 
 
+def _matches_token(series: pd.Series, token: str) -> np.ndarray:
+    """
+    Return a mask of values equal to ``token`` after trimming and lowercasing.
+
+    event_type holds a handful of distinct values, so the values are factorized and only the
+    distinct labels are normalized in Python; rows are then matched by integer code.
+    """
+    codes, uniques = pd.factorize(series)
+    matching_codes = [
+        code for code, value in enumerate(uniques) if str(value).strip().lower() == token
+    ]
+    return np.isin(codes, matching_codes)
+
+
+def _numeric_values(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Return a column coerced to float64 as a plain array, NaN where missing or unparseable."""
+    return coerce_numeric(get_series(df, column)).to_numpy(dtype="float64", na_value=np.nan)
+
+
+def _cumcount(codes: np.ndarray) -> np.ndarray:
+    """
+    Return each element's 0-based occurrence number within its code, in input order.
+
+    Equivalent to ``groupby(codes).cumcount()`` using one stable sort: within a run of equal
+    sorted codes, the occurrence number is the distance from the start of the run.
+    """
+    if codes.size == 0:
+        return np.zeros(0, dtype=np.int64)
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    positions = np.arange(codes.size, dtype=np.int64)
+    run_starts = np.empty(codes.size, dtype=bool)
+    run_starts[0] = True
+    np.not_equal(sorted_codes[1:], sorted_codes[:-1], out=run_starts[1:])
+    run_start_positions = np.maximum.accumulate(np.where(run_starts, positions, 0))
+    counts = np.empty(codes.size, dtype=np.int64)
+    counts[order] = positions - run_start_positions
+    return counts
+
+
 def add_shot_index(df: pd.DataFrame) -> pd.DataFrame:
     """
     Add shot_index for damage events only (Attack rows with total_normal > 0).
     Non-damage rows get NA.
-    """
-    updated = df.copy()
-    updated.attrs = df.attrs.copy()
 
-    typ = updated["event_type"].astype(str).str.strip().str.lower()
-    total_damage = coerce_numeric(get_series(updated, "total_normal"))
-    shield_damage = coerce_numeric(get_series(updated, "shield_damage"))
-    hull_damage = coerce_numeric(get_series(updated, "hull_damage"))
-    pool_positive = (shield_damage > 0) | (hull_damage > 0)
+    Returns a shallow copy of ``df`` with the new column, so the existing column buffers are
+    shared rather than duplicated.
+    """
+    is_attack = _matches_token(df["event_type"], "attack")
+    # Combine the masks as numpy arrays: Series operators would allocate and align an index
+    # for every intermediate result.
+    pool_positive = (_numeric_values(df, "shield_damage") > 0) | (
+        _numeric_values(df, "hull_damage") > 0
+    )
 
-    if "total_normal" in updated.columns:
-        total_positive = total_damage > 0
-        total_missing = total_damage.isna()
-        is_shot = (typ == "attack") & (total_positive | (total_missing & pool_positive))
+    if "total_normal" in df.columns:
+        total_damage = _numeric_values(df, "total_normal")
+        shot_mask = is_attack & ((total_damage > 0) | (np.isnan(total_damage) & pool_positive))
     else:
-        is_shot = (typ == "attack") & pool_positive
+        shot_mask = is_attack & pool_positive
 
-    shot_index = pd.Series(pd.NA, index=updated.index, dtype="Int64")
-    attacker_column = resolve_column(updated, ATTACKER_COLUMN_CANDIDATES)
-    target_column = resolve_column(updated, TARGET_COLUMN_CANDIDATES)
+    shot_values = np.zeros(len(df), dtype=np.int64)
+    attacker_column, target_column = resolve_actor_columns(df)
     if attacker_column and target_column:
-        shot_counts = (
-            updated.loc[is_shot]
-            .groupby([attacker_column, target_column], dropna=False)
-            .cumcount()
-            .add(1)
+        # Factorize each side (missing names form their own group, as groupby(dropna=False)
+        # did) and combine into one pair code per shot.
+        attacker_codes, attacker_uniques = pd.factorize(
+            df[attacker_column].to_numpy()[shot_mask], use_na_sentinel=False
         )
-        shot_index.loc[is_shot] = shot_counts.astype("Int64")
+        target_codes, _ = pd.factorize(
+            df[target_column].to_numpy()[shot_mask], use_na_sentinel=False
+        )
+        pair_codes = target_codes.astype(np.int64) * len(attacker_uniques) + attacker_codes
+        shot_values[shot_mask] = _cumcount(pair_codes) + 1
     else:
-        shot_index.loc[is_shot] = np.arange(1, int(is_shot.sum()) + 1, dtype=np.int64)
+        shot_values[shot_mask] = np.arange(1, int(shot_mask.sum()) + 1, dtype=np.int64)
+    # Build the nullable column once from values plus a mask (NA for non-shot rows), rather
+    # than filling an all-NA Int64 series through .loc assignment.
+    shot_index = pd.Series(pd.arrays.IntegerArray(shot_values, ~shot_mask), index=df.index)
 
+    # A shallow copy shares column data; adding a column only touches the copy's own manager.
+    updated = df.copy(deep=False)
+    updated.attrs = df.attrs.copy()
     updated["shot_index"] = shot_index
     return updated
@@ -16,6 +16,15 @@ logger = logging.getLogger(__name__)
 DEFAULT_UPLOAD_TYPES: Iterable[str] = ("tsv", "csv", "txt")
 
 
+def compute_upload_hash(data: bytes) -> str:
+    """
+    Return the session-state dedupe key for an uploaded battle log.
+
+    The hash is only a cache key, so BLAKE2b (faster than MD5 in CPython) is used.
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
 def _hydrate_battle_metadata(df: pd.DataFrame) -> pd.DataFrame:
     """Ensure battle metadata dataframes are present in attrs/session state."""
     players_df = df.attrs.get("players_df")
@@ -64,7 +73,7 @@ def render_sidebar_combat_log_upload(
         return battle_df
 
     data = uploaded.getvalue()
-    upload_hash = hashlib.md5(data).hexdigest()
+    upload_hash = compute_upload_hash(data)
     if st.session_state.get("battle_upload_hash") == upload_hash:
         battle_df = st.session_state.get("battle_df")
         if isinstance(battle_df, pd.DataFrame):
@@ -8,6 +8,7 @@ logger = logging.getLogger(__name__)
 
 import re
 from datetime import datetime
+from typing import Mapping
 
 import pandas as pd
 import streamlit as st
@@ -17,9 +18,7 @@ from veschov.io.ShipSpecifier import ShipSpecifier
 from veschov.ui.components.number_format import format_number
 
 from veschov.transforms.columns import (
-    ATTACKER_COLUMN_CANDIDATES,
-    TARGET_COLUMN_CANDIDATES,
-    resolve_column,
+    resolve_actor_columns,
 )
 
 BAR_COLORS = {
@@ -157,9 +156,9 @@ def render_ratio_bar(
     st.markdown(bar_html, unsafe_allow_html=True)
 
 
-def _format_context(players_df: pd.DataFrame, battle_df: pd.DataFrame | None) -> list[str]:
-    location = players_df["Location"].iloc[0] if "Location" in players_df.columns else None
-    timestamp = players_df["Timestamp"].iloc[0] if "Timestamp" in players_df.columns else None
+def _format_context(first_row: Mapping[str, object], battle_df: pd.DataFrame | None) -> list[str]:
+    location = first_row.get("Location")
+    timestamp = first_row.get("Timestamp")
     lines: list[str] = []
 
     context_parts: list[str] = []
@@ -169,9 +168,9 @@ def _format_context(players_df: pd.DataFrame, battle_df: pd.DataFrame | None) ->
             location_text = f"{location_text} System"
         context_parts.append(location_text)
     if pd.notna(timestamp):
-        parsed = pd.to_datetime(timestamp, errors="coerce")
-        if pd.notna(parsed):
-            parsed_dt = parsed.to_pydatetime()
+        # The player parser stores Timestamp as datetime64, so there is nothing to re-parse.
+        if isinstance(timestamp, datetime):
+            parsed_dt = timestamp
             today_year = datetime.now().year
             date_part = f"{parsed_dt:%a} {parsed_dt.day} {parsed_dt:%b}"
             if parsed_dt.year != today_year:
@@ -192,8 +191,7 @@ def _format_context(players_df: pd.DataFrame, battle_df: pd.DataFrame | None) ->
 
 
 def total_shots_by_attacker(battle_df: pd.DataFrame) -> dict[str, int]:
-    attacker_column = resolve_column(battle_df, ATTACKER_COLUMN_CANDIDATES)
-    target_column = resolve_column(battle_df, TARGET_COLUMN_CANDIDATES)
+    attacker_column, target_column = resolve_actor_columns(battle_df)
     if not attacker_column:
         return {}
     if "total_normal" in battle_df.columns:
@@ -327,7 +325,7 @@ def _alliance_lookup(
 
 
 def _format_combatant_label(
-        row: pd.Series,
+        row: Mapping[str, object],
         name_lookup: dict[str, str],
         ship_lookup: dict[tuple[str, str], str],
 ) -> str:
@@ -344,16 +342,16 @@ def _format_combatant_label(
 
 def _render_combatant_list(
         title: str,
-        rows: pd.DataFrame,
+        rows: list[dict[str, object]],
         name_lookup: dict[str, str],
         ship_lookup: dict[tuple[str, str], str],
 ) -> None:
     st.markdown(f"**{title}**")
-    if rows.empty:
+    if not rows:
         st.caption("None listed in the current log.")
         return
     lines = []
-    for _, row in rows.iterrows():
+    for row in rows:
         emoji = _outcome_emoji(row.get("Outcome"))
         label = _format_combatant_label(row, name_lookup, ship_lookup)
         lines.append(f"- {emoji} {label}")
@@ -372,7 +370,10 @@ def render_combat_summary(
         st.info("No player metadata found in this file.")
         return
 
-    context_lines = _format_context(players_df, battle_df)
+    # The players table has a handful of rows; read them as plain dicts once instead of going
+    # through iloc/iterrows for every field lookup.
+    records = players_df.to_dict("records")
+    context_lines = _format_context(records[0], battle_df)
     if context_lines:
         context_text = " • ".join(context_lines)
         st.markdown(
@@ -384,8 +385,8 @@ def render_combat_summary(
     session_info = st.session_state.get("session_info")
     name_lookup, ship_lookup = _alliance_lookup(session_info)
 
-    players_rows = players_df.iloc[:-1] if len(players_df) > 1 else players_df.iloc[0:0]
-    npc_row = players_df.iloc[-1:]
+    players_rows = records[:-1]
+    npc_row = records[-1:]
 
     list_cols = st.columns(2)
     with list_cols[0]:
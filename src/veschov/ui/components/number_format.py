@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 
-import humanize
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -27,6 +27,18 @@ def get_number_format() -> str:
     return stored_value
 
 
+def _intword(value: float, humanize_format: str) -> str:
+    """
+    Spell out a large number ("1.2 million").
+
+    humanize is imported here rather than at module level: this module is loaded by every
+    report page, but only Human-formatted values of a million or more need it.
+    """
+    import humanize
+
+    return humanize.intword(value, format=humanize_format)
+
+
 def format_number(
     value: object,
     *,
@@ -42,9 +54,52 @@ def format_number(
     numeric = pd.to_numeric(value, errors="coerce")
     if pd.notna(numeric):
         if abs(numeric) >= 1_000_000 and number_format == "Human":
-            return humanize.intword(numeric, format=humanize_format)
+            return _intword(numeric, humanize_format)
         if float(numeric).is_integer():
             return f"{int(numeric):,}"
         return f"{numeric:,}"
     text = str(value).strip()
     return text or null_display
+
+
+def format_number_series(
+    series: pd.Series,
+    *,
+    number_format: str,
+    humanize_format: str = "%.1f",
+    null_display: str = "—",
+) -> pd.Series:
+    """
+    Format every value of ``series`` as format_number would.
+
+    Numeric columns skip format_number's per-value NA check and ``pd.to_numeric`` call: the
+    column is read as float64 once, each distinct value is formatted once, and the strings are
+    scattered back by integer code. Other dtypes fall back to formatting value by value.
+    """
+    if not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+        return series.map(
+            lambda value: format_number(
+                value,
+                number_format=number_format,
+                humanize_format=humanize_format,
+                null_display=null_display,
+            )
+        )
+    values = series.to_numpy(dtype="float64", na_value=np.nan)
+    codes, uniques = pd.factorize(values)
+    # Classify every distinct value with array ops; only the string rendering stays per value.
+    if number_format == "Human":
+        large = np.abs(uniques) >= 1_000_000
+    else:
+        large = np.zeros(uniques.shape, dtype=bool)
+    integral = ~large & np.isfinite(uniques) & (uniques == np.trunc(uniques))
+    plain = ~(large | integral)
+    # factorize marks NaN with code -1, so the null label sits at the end of the lookup table.
+    labels = np.empty(uniques.size + 1, dtype=object)
+    value_labels = labels[:-1]
+    value_labels[large] = [_intword(value, humanize_format) for value in uniques[large].tolist()]
+    value_labels[integral] = [f"{int(value):,}" for value in uniques[integral].tolist()]
+    value_labels[plain] = [f"{value:,}" for value in uniques[plain].tolist()]
+    labels[-1] = null_display
+    formatted = labels[codes]
+    return pd.Series(formatted, index=series.index, name=series.name, dtype=object)
@@ -6,10 +6,8 @@ import logging
 from typing import Iterable
 import pandas as pd
 from veschov.transforms.columns import (
-    ATTACKER_COLUMN_CANDIDATES,
-    TARGET_COLUMN_CANDIDATES,
     get_series,
-    resolve_column,
+    resolve_actor_columns,
 )
 from veschov.utils.series import coerce_numeric
 
@@ -133,8 +131,7 @@ def _resolve_hover_columns(df: pd.DataFrame) -> list[str]:
         if column in df.columns:
             hover_columns.append(column)
 
-    attacker_column = resolve_column(df, ATTACKER_COLUMN_CANDIDATES)
-    target_column = resolve_column(df, TARGET_COLUMN_CANDIDATES)
+    attacker_column, target_column = resolve_actor_columns(df)
     for column in (attacker_column, target_column):
         if column and column in df.columns:
             hover_columns.append(column)
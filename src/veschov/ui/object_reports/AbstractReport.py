@@ -14,7 +14,7 @@ from streamlit.runtime.scriptrunner_utils import script_run_context
 from veschov.io.parser_stub import parse_battle_log
 from veschov.ui.chirality import Lens
 from veschov.ui.components.combat_log_upload import render_sidebar_combat_log_upload
-from veschov.ui.components.number_format import format_number
+from veschov.ui.components.number_format import format_number, format_number_series
 from veschov.ui.pretty_stats.Statistic import Statistic, render_stats
 
 LOGGER = logging.getLogger(__name__)
@@ -153,7 +153,7 @@ class AbstractReport(ABC):
             number_format: str,
     ) -> pd.Series:
         """Format a series of values with the configured large-number formatter."""
-        return series.map(lambda value: self._format_large_number(value, number_format))
+        return format_number_series(series, number_format=number_format, humanize_format="%.1f")
 
     def _prepend_page_icon(self, title_text: Optional[str]) -> Optional[str]:
         """Ensure the title includes the page icon from `.streamlit/pages.toml`."""
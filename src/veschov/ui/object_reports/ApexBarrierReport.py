@@ -74,12 +74,20 @@ class ApexBarrierReport(RoundOrShotsReport):
             return None
         return float(total)
 
-    def _coerce_apex_hit(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _apex_hit_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Return the rows with a numeric apex_barrier_hit, with that column coerced.
+
+        The mask is computed on the source frame so only the surviving rows are copied, once.
+        """
         if "apex_barrier_hit" not in df.columns:
             raise KeyError("apex_barrier_hit")
-        df = df.copy()
-        df["apex_barrier_hit"] = coerce_numeric(df["apex_barrier_hit"])
-        return df
+        apex_hit = coerce_numeric(df["apex_barrier_hit"])
+        mask = apex_hit.notna()
+        display_df = df.loc[mask].copy()
+        display_df.attrs = {}
+        display_df["apex_barrier_hit"] = apex_hit[mask]
+        return display_df
 
     def _prepare_shot_index(self, df: pd.DataFrame) -> pd.DataFrame:
         if "shot_index" not in df.columns:
@@ -98,19 +106,14 @@ class ApexBarrierReport(RoundOrShotsReport):
         return shot_df
 
     def get_derived_dataframes(self, df: pd.DataFrame, lens) -> Optional[list[pd.DataFrame]]:
-        display_df = df.copy()
-        display_df.attrs = {}
-
+        # include_missing = st.checkbox("Include rows without Apex Barrier hit", value=False)
+        # if not include_missing:
         try:
-            display_df = self._coerce_apex_hit(display_df)
+            display_df = self._apex_hit_rows(df)
         except KeyError as exc:
             st.error(f"Missing required column: {exc.args[0]}")
             return None
 
-        # include_missing = st.checkbox("Include rows without Apex Barrier hit", value=False)
-        # if not include_missing:
-        display_df = display_df[display_df["apex_barrier_hit"].notna()].copy()
-
         filtered_df = self.apply_combat_lens(display_df, lens)
         if filtered_df.empty:
             st.warning("No matching Apex Barrier events found for this selection.")
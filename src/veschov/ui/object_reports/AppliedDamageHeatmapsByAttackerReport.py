@@ -12,7 +12,7 @@ import streamlit as st
 from veschov.io.SessionInfo import SessionInfo, ShipSpecifier
 from veschov.transforms.columns import (
     ATTACKER_COLUMN_CANDIDATES,
-    TARGET_COLUMN_CANDIDATES,
+    resolve_actor_columns,
     resolve_column,
 )
 from veschov.ui.components.number_format import get_number_format
@@ -263,8 +263,7 @@ class AppliedDamageHeatmapsByAttackerReport(AttackerAndTargetReport):
             st.error(f"Missing required columns: {', '.join(missing_columns)}")
             return None
 
-        attacker_column = resolve_column(display_df, ATTACKER_COLUMN_CANDIDATES)
-        target_column = resolve_column(display_df, TARGET_COLUMN_CANDIDATES)
+        attacker_column, target_column = resolve_actor_columns(display_df)
         if attacker_column is None:
             logger.warning("Applied damage heatmaps missing attacker column candidates.")
             st.error("Missing attacker column for filtering.")
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from abc import ABC
 from datetime import datetime
-from typing import Sequence, Set, TypedDict
+from typing import Mapping, Sequence, Set, TypedDict
 
 import pandas as pd
 import streamlit as st
@@ -259,9 +259,8 @@ class AttackerAndTargetReport(AbstractReport, ABC):
             if location_text and "system" not in location_text.lower():
                 location_text = f"{location_text} System"
         if pd.notna(timestamp):
-            parsed = pd.to_datetime(timestamp, errors="coerce")
-            if pd.notna(parsed):
-                parsed_dt = parsed.to_pydatetime()
+            if isinstance(timestamp, datetime):
+                parsed_dt = timestamp
                 today_year = datetime.now().year
                 date_part = f"{parsed_dt:%a} {parsed_dt.day} {parsed_dt:%b}"
                 if parsed_dt.year != today_year:
@@ -410,8 +409,14 @@ class AttackerAndTargetReport(AbstractReport, ABC):
             self,
             players_df: pd.DataFrame | None,
             options: Sequence[ShipSpecifier],
+            serialized_options: Mapping[ShipSpecifier, SerializedShipSpec],
     ) -> tuple[list[SerializedShipSpec], list[SerializedShipSpec]]:
-        """Build default attacker/target selections for state initialization."""
+        """
+        Build default attacker/target selections for state initialization.
+
+        ``serialized_options`` maps each option to its already-serialized key, so defaults
+        (always drawn from ``options``) are not serialized a second time.
+        """
         # FIX12 players_df should not be empty
         target_fallback, target_reason = self._default_target_from_players(players_df, options)
         if not target_fallback:
@@ -423,8 +428,8 @@ class AttackerAndTargetReport(AbstractReport, ABC):
             if not target_fallback:
                 target_fallback = list(options[-1:])
             target_reason = target_reason if target_reason else "forced fallback to first option"
-        default_attacker_specs = [serialize_spec(spec) for spec in attacker_fallback]
-        default_target_specs = [serialize_spec(spec) for spec in target_fallback]
+        default_attacker_specs = [serialized_options[spec] for spec in attacker_fallback]
+        default_target_specs = [serialized_options[spec] for spec in target_fallback]
         logger.debug(
             "Default attacker specs=%s; target specs=%s (reason=%s).",
             default_attacker_specs,
@@ -448,18 +453,14 @@ class AttackerAndTargetReport(AbstractReport, ABC):
             st.warning("No ship data available to select attacker/target.")
             return (), ()
 
-        spec_lookup = {serialize_spec(spec): spec for spec in options}
+        # Serialize each option once; the lookup and defaults reuse these keys.
         available_specs = [serialize_spec(spec) for spec in options]
-        missing_in_lookup = [spec for spec in available_specs if spec not in spec_lookup]
-        if missing_in_lookup:
-            logger.warning(
-                "Available specs missing from lookup during selector render: %s",
-                missing_in_lookup,
-            )
+        spec_lookup = dict(zip(available_specs, options))
         # FIX12 players_df should not be empty
         default_attacker_specs, default_target_specs = self._build_default_attacker_target_defaults(
             players_df,
             options,
+            dict(zip(options, available_specs)),
         )
         outcome_lookup = (
             session_info.build_outcome_lookup()
@@ -590,13 +591,14 @@ class AttackerAndTargetReport(AbstractReport, ABC):
         if not options:
             return [], []
         players_df = session_info.players_df if isinstance(session_info, SessionInfo) else None
-        spec_lookup = {serialize_spec(spec): spec for spec in options}
         available_specs = [serialize_spec(spec) for spec in options]
+        spec_lookup = dict(zip(available_specs, options))
         # FIX12 players_df should not be empty
         # Missing player metadata can reset selections; guard against it.
         default_attacker_specs, default_target_specs = self._build_default_attacker_target_defaults(
             players_df,
             options,
+            dict(zip(options, available_specs)),
         )
         manager = AttackerTargetStateManager(
             spec_lookup=spec_lookup,
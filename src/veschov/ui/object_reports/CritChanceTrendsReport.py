@@ -23,6 +23,47 @@ CRIT_LINE_COLOR = "#1f77b4"
 SMOOTHED_LINE_COLOR = "#d62728"
 TREND_LINE_COLOR = "#2ca02c"
 CI_FILL_COLOR = "rgba(31, 119, 180, 0.15)"
+# Above this many points per trace, render with WebGL instead of SVG.
+WEBGL_POINT_THRESHOLD = 2000
+# Most points drawn per shot view trace; longer series are reduced to per-bucket extremes.
+DOWNSAMPLE_MAX_POINTS = 6000
+# Shot view columns whose extremes survive downsampling.
+DOWNSAMPLE_COLUMNS = ("crit_chance", "smoothed")
+
+
+def _m4_indices(length: int, buckets: int, *columns: np.ndarray) -> np.ndarray:
+    """
+    Return sorted row positions to keep when drawing ``length`` points into ``buckets`` columns.
+
+    M4-style aggregation: each bucket keeps its first and last rows plus the rows holding the
+    minimum and maximum of every column in ``columns``. Real rows are selected rather than
+    synthesized, so all traces sharing the x axis stay aligned and the line looks the same at
+    plot resolution.
+    """
+    edges = np.unique(np.linspace(0, length, buckets + 1).astype(np.int64))
+    bucket_ids = np.repeat(np.arange(edges.size - 1), np.diff(edges))
+    keep = [edges[:-1], edges[1:] - 1]
+    for values in columns:
+        # Sort by bucket, then by value: each bucket's first entry is its minimum and its last
+        # entry its maximum (NaN sorts last, which only ever keeps an extra real row).
+        order = np.lexsort((values, bucket_ids))
+        keep.append(order[edges[:-1]])
+        keep.append(order[edges[1:] - 1])
+    return np.unique(np.concatenate(keep))
+
+
+def _downsample_shot_view(shot_view_df: pd.DataFrame) -> pd.DataFrame:
+    """Return at most ``DOWNSAMPLE_MAX_POINTS`` rows of the shot view, keeping M4 extremes."""
+    if len(shot_view_df) <= DOWNSAMPLE_MAX_POINTS:
+        return shot_view_df
+    # _m4_indices keeps up to two edge rows plus a min and max row per column in each bucket.
+    buckets = DOWNSAMPLE_MAX_POINTS // (2 + 2 * len(DOWNSAMPLE_COLUMNS))
+    keep = _m4_indices(
+        len(shot_view_df),
+        buckets,
+        *(shot_view_df[column].to_numpy(dtype=float) for column in DOWNSAMPLE_COLUMNS),
+    )
+    return shot_view_df.iloc[keep]
 
 
 class CritChanceTrendsReport(RoundOrShotsReport):
@@ -189,15 +230,18 @@ class CritChanceTrendsReport(RoundOrShotsReport):
         return summary
 
     def _build_shot_plot(self, shot_view_df: pd.DataFrame) -> go.Figure:
+        shot_view_df = _downsample_shot_view(shot_view_df)
         x_values = shot_view_df["shot_index_global"].astype(int)
         crit_pct = shot_view_df["crit_chance"] * 100.0
         smoothed_pct = shot_view_df["smoothed"] * 100.0
         lower_pct = shot_view_df["wilson_lower"] * 100.0
         upper_pct = shot_view_df["wilson_upper"] * 100.0
 
+        # Long battles produce one point per shot; SVG traces slow down badly at that size.
+        scatter = go.Scattergl if len(shot_view_df) > WEBGL_POINT_THRESHOLD else go.Scatter
         fig = go.Figure()
         fig.add_trace(
-            go.Scatter(
+            scatter(
                 x=x_values,
                 y=upper_pct,
                 mode="lines",
@@ -207,7 +251,7 @@ class CritChanceTrendsReport(RoundOrShotsReport):
             )
         )
         fig.add_trace(
-            go.Scatter(
+            scatter(
                 x=x_values,
                 y=lower_pct,
                 mode="lines",
@@ -219,7 +263,7 @@ class CritChanceTrendsReport(RoundOrShotsReport):
             )
         )
         fig.add_trace(
-            go.Scatter(
+            scatter(
                 x=x_values,
                 y=crit_pct,
                 mode="lines",
@@ -228,7 +272,7 @@ class CritChanceTrendsReport(RoundOrShotsReport):
             )
         )
         fig.add_trace(
-            go.Scatter(
+            scatter(
                 x=x_values,
                 y=smoothed_pct,
                 mode="lines",
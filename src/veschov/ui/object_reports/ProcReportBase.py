@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable, Optional
+from typing import AbstractSet, Iterable, Optional
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+from veschov.ui.chirality import Lens
+from veschov.ui.components.combat_lens import apply_combat_lens
 from veschov.ui.object_reports.AttackerAndTargetReport import AttackerAndTargetReport
 
 logger = logging.getLogger(__name__)
@@ -16,6 +19,10 @@ PROC_TYPES: tuple[str, ...] = (
     "Officer",
     "ForbiddenTechAbility",
 )
+# Membership-only views of PROC_TYPES, built once instead of on every isin call.
+_ALL_PROC_TYPES: frozenset[str] = frozenset(PROC_TYPES)
+_OFFICER_PROC_TYPES: frozenset[str] = frozenset(PROC_TYPES[:1])
+_MISSING_ABILITY_LABELS: frozenset[str] = frozenset(("", "--"))
 REQUIRED_COLUMNS: tuple[str, ...] = (
     "ability_name",
     "ability_value",
@@ -36,73 +43,97 @@ COLUMN_ALIASES: dict[str, tuple[str, ...]] = {
 }
 
 
-def _resolve_column(df: pd.DataFrame, candidates: Iterable[str]) -> str | None:
-    """Return the first matching column name in the dataframe."""
-    return next((candidate for candidate in candidates if candidate in df.columns), None)
+def _resolve_column(columns: AbstractSet[str], candidates: Iterable[str]) -> str | None:
+    """Return the first candidate present in ``columns``."""
+    return next((candidate for candidate in candidates if candidate in columns), None)
 
 
 def _normalize_required_columns(df: pd.DataFrame) -> tuple[pd.DataFrame, list[str]]:
-    """Normalize required columns and return missing column names."""
-    updated = df.copy()
+    """
+    Normalize required columns and return missing column names.
+
+    Returns ``df`` itself when no column needs renaming; otherwise one rename builds the result.
+    """
     missing = []
+    renames: dict[str, str] = {}
+    columns = set(df.columns)
     for canonical, candidates in COLUMN_ALIASES.items():
-        resolved = _resolve_column(updated, candidates)
+        resolved = _resolve_column(columns, candidates)
         if resolved is None:
             missing.append(canonical)
             continue
         if resolved != canonical:
-            updated = updated.rename(columns={resolved: canonical})
-    return updated, missing
+            renames[resolved] = canonical
+    if not renames:
+        return df, missing
+    return df.rename(columns=renames), missing
+
+
+def _normalized_event_types(df: pd.DataFrame) -> pd.Series:
+    """
+    Return ``event_type`` as stripped strings with nulls mapped to empty.
+
+    Parsed logs store event_type as Arrow-backed strings; for those the ``astype(str)`` round-trip
+    (which materializes Python objects) is skipped and the strip runs in Arrow compute.
+    """
+    event_types = df["event_type"].fillna("")
+    if not isinstance(event_types.dtype, pd.StringDtype):
+        event_types = event_types.astype(str)
+    return event_types.str.strip()
 
 
 def _debug_proc_counts(label: str, df: pd.DataFrame) -> None:
     """Emit debug information about filtered proc rows."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     if "event_type" not in df.columns:
         logger.debug("%s: event_type column missing; rows=%s", label, len(df))
         return
-    event_types = df["event_type"].fillna("").astype(str).str.strip()
-    proc_rows = event_types.isin(PROC_TYPES).sum()
+    event_types = _normalized_event_types(df)
+    proc_rows = event_types.isin(_ALL_PROC_TYPES).sum()
     logger.debug("%s: rows=%s proc_rows=%s", label, len(df), proc_rows)
 
 
 def _coerce_numeric(series: pd.Series) -> pd.Series:
     """Coerce a series to numeric values, ignoring errors."""
-    cleaned = series.astype(str).str.replace(",", "", regex=False).str.strip()
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        # Parsed logs already carry numeric rounds; skip the string round-trip.
+        return pd.to_numeric(series, errors="coerce")
+    # One regex pass drops thousands separators and leading/trailing whitespace together.
+    cleaned = series.astype(str).str.replace(r",|^\s+|\s+$", "", regex=True)
     return pd.to_numeric(cleaned, errors="coerce")
 
 
-def _normalize_round(df: pd.DataFrame) -> pd.DataFrame:
-    """Normalize round values to consistent sorting."""
-    updated = df.copy()
+def _normalize_round(updated: pd.DataFrame) -> None:
+    """Normalize round values to consistent sorting, in place."""
     round_series = updated["round"]
     round_numeric = _coerce_numeric(round_series)
-    if round_numeric.notna().sum() == round_series.notna().sum() and round_series.notna().any():
+    present = round_series.notna()
+    # Every present round parsed as a number (and at least one is present).
+    if present.any() and not (present & round_numeric.isna()).any():
         updated["round"] = round_numeric.astype("Int64")
     else:
         round_values = round_series.fillna("Unknown").astype(str)
         categories = sorted(round_values.unique())
         updated["round"] = pd.Categorical(round_values, categories=categories, ordered=True)
-    return updated
 
 
-def _normalize_proc_labels(df: pd.DataFrame) -> pd.DataFrame:
-    """Normalize owner/ability labels for display."""
-    updated = df.copy()
+def _normalize_proc_labels(updated: pd.DataFrame) -> None:
+    """Add normalized owner/ability display labels, in place."""
     owner = updated["ability_owner_name"].fillna("Unknown").astype(str).str.strip()
     owner = owner.replace("", "Unknown")
 
     ability = updated["ability_name"].fillna("--").astype(str).str.strip()
     ability = ability.replace("", "--")
-    missing_ability = ability.isin(("", "--"))
+    missing_ability = ability.isin(_MISSING_ABILITY_LABELS)
 
-    value_series = updated["ability_value"].where(updated["ability_value"].notna(), None)
-    value_label = value_series.apply(lambda value: str(value).strip() if value is not None else "")
+    # Nullable strings keep NA through the vectorized strip; NA then becomes "".
+    value_label = updated["ability_value"].astype("string").str.strip().fillna("")
     fallback_label = value_label.where(value_label != "", "Unknown")
     ability = ability.where(~missing_ability, fallback_label)
 
     updated["owner"] = owner
     updated["ability"] = ability
-    return updated
 
 
 @st.cache_data(show_spinner=False)
@@ -114,38 +145,71 @@ def _get_proc_df(battle_df: pd.DataFrame, include_forbidden_tech: bool) -> pd.Da
     if not battle_df["event_type"].notna().any():
         logger.warning("event_type column has no non-null values")
         return pd.DataFrame()
-    allowed_types = PROC_TYPES if include_forbidden_tech else (PROC_TYPES[0],)
-    event_type_values = battle_df["event_type"].fillna("").astype(str).str.strip()
+    allowed_types = _ALL_PROC_TYPES if include_forbidden_tech else _OFFICER_PROC_TYPES
+    event_type_values = _normalized_event_types(battle_df)
     filtered = battle_df[event_type_values.isin(allowed_types)].copy()
     logger.debug("_get_proc_df: after event_type filter row count=%s", len(filtered))
     if filtered.empty:
         return filtered
-    filtered = _normalize_round(filtered)
+    # filtered is this function's own copy, so the normalizers update it in place.
+    _normalize_round(filtered)
     logger.debug("_get_proc_df: after _normalize_round row count=%s", len(filtered))
-    filtered = _normalize_proc_labels(filtered)
+    _normalize_proc_labels(filtered)
     logger.debug("_get_proc_df: after _normalize_proc_labels row count=%s", len(filtered))
     return filtered
 
 
 @st.cache_data(show_spinner=False)
-def build_proc_matrix(
+def _proc_df_and_owners(
+        battle_df: pd.DataFrame,
+        include_forbidden_tech: bool,
+) -> tuple[pd.DataFrame, tuple[str, ...]]:
+    """Return the proc rows with their sorted distinct owners, cached alongside them."""
+    proc_df = _get_proc_df(battle_df, include_forbidden_tech)
+    if proc_df.empty:
+        return proc_df, ()
+    return proc_df, tuple(sorted(proc_df["owner"].dropna().unique()))
+
+
+@st.cache_data(show_spinner=False)
+def _proc_count_matrix(
         battle_df: pd.DataFrame,
         include_forbidden_tech: bool,
-        show_totals: bool,
-        show_distinct: bool,
         owner_filter: tuple[str, ...] | None = None,
 ) -> pd.DataFrame:
-    """Build a round-by-owner matrix of proc counts."""
+    """
+    Return proc counts with rounds as rows and (owner, ability) columns, both sorted.
+
+    Shared by build_proc_matrix and build_proc_summary so the grouping runs once per battle,
+    proc set, and owner filter. Returns an empty frame when no proc rows remain.
+    """
     proc_df = _get_proc_df(battle_df, include_forbidden_tech)
     if owner_filter:
-        proc_df = proc_df[proc_df["owner"].isin(owner_filter)]
+        proc_df = proc_df[proc_df["owner"].isin(frozenset(owner_filter))]
 
     if proc_df.empty:
         return pd.DataFrame()
 
-    counts = proc_df.groupby(["round", "owner", "ability"], dropna=False).size()
-    matrix = counts.unstack(["owner", "ability"]).fillna(0).astype(int)
-    matrix = matrix.sort_index(axis=1).sort_index(axis=0)
+    counts = proc_df.groupby(["round", "owner", "ability"], dropna=False, observed=True).size()
+    # Per-round proc counts are small: store them in the narrowest unsigned type that fits
+    # (almost always uint8) to shrink the cached matrix and what is sent to the browser.
+    count_dtype = np.min_scalar_type(int(counts.max()))
+    matrix = counts.unstack(["owner", "ability"], fill_value=0).astype(count_dtype)
+    return matrix.sort_index(axis=1).sort_index(axis=0)
+
+
+@st.cache_data(show_spinner=False)
+def build_proc_matrix(
+        battle_df: pd.DataFrame,
+        include_forbidden_tech: bool,
+        show_totals: bool,
+        show_distinct: bool,
+        owner_filter: tuple[str, ...] | None = None,
+) -> pd.DataFrame:
+    """Build a round-by-owner matrix of proc counts."""
+    matrix = _proc_count_matrix(battle_df, include_forbidden_tech, owner_filter)
+    if matrix.empty:
+        return matrix
 
     proc_matrix = matrix.copy()
     if show_totals:
@@ -166,24 +230,17 @@ def build_proc_summary(
         owner_filter: tuple[str, ...] | None = None,
 ) -> pd.DataFrame:
     """Summarize proc totals and rounds active by owner/ability."""
-    proc_df = _get_proc_df(battle_df, include_forbidden_tech)
-    if owner_filter:
-        proc_df = proc_df[proc_df["owner"].isin(owner_filter)]
-
-    if proc_df.empty:
-        return pd.DataFrame()
-
-    counts = proc_df.groupby(["round", "owner", "ability"], dropna=False).size()
-    matrix = counts.unstack(["owner", "ability"]).fillna(0).astype(int)
-    matrix = matrix.sort_index(axis=1).sort_index(axis=0)
+    matrix = _proc_count_matrix(battle_df, include_forbidden_tech, owner_filter)
+    if matrix.empty:
+        return matrix
 
     totals = matrix.sum(axis=0)
-    rounds_active = (matrix > 0).sum(axis=0)
+    positive = matrix > 0
+    rounds_active = positive.sum(axis=0)
     avg_per_active = totals / rounds_active.replace(0, pd.NA)
-    first_rounds = []
-    for column in matrix.columns:
-        active = matrix[column][matrix[column] > 0]
-        first_rounds.append(active.index[0] if not active.empty else pd.NA)
+    # Rows are sorted by round, so idxmax over the boolean frame finds each column's first
+    # active round; columns that never fired get NA.
+    first_rounds = positive.idxmax(axis=0).where(rounds_active > 0, pd.NA)
 
     summary = pd.DataFrame(
         {
@@ -192,7 +249,7 @@ def build_proc_summary(
             "Total fires": totals.values,
             "Rounds active": rounds_active.values,
             "Avg fires per active round": avg_per_active.values,
-            "First round fired": first_rounds,
+            "First round fired": first_rounds.values,
         }
     )
     summary = summary.sort_values("Total fires", ascending=False, kind="stable").reset_index(
@@ -201,22 +258,61 @@ def build_proc_summary(
     return summary
 
 
+@st.cache_data(show_spinner=False)
+def _heatmap_styles(df: pd.DataFrame, heat_cap: int) -> pd.DataFrame:
+    """
+    Return the per-cell CSS for a proc count heatmap.
+
+    Cached on the matrix content and heat cap, so reruns that leave the matrix unchanged skip
+    recomputing the styles.
+    """
+    # Counts are clipped to heat_cap, so there are only heat_cap + 1 distinct cell styles; build
+    # them once and pick per cell with one array index instead of a Python call per cell.
+    palette = np.array(
+        [""]
+        + [
+            f"background-color: rgba(255, 140, 0, {count / heat_cap:.2f});"
+            for count in range(1, heat_cap + 1)
+        ],
+        dtype=object,
+    )
+    counts = df.to_numpy(dtype="float64", na_value=np.nan)
+    levels = np.clip(np.nan_to_num(np.trunc(counts), nan=0.0), 0, heat_cap).astype(int)
+    return pd.DataFrame(palette[levels], index=df.index, columns=df.columns)
+
+
 def style_heatmap(df: pd.DataFrame, heat_cap: int) -> pd.io.formats.style.Styler:
     """Apply heatmap styling for proc counts."""
+    styles = _heatmap_styles(df, heat_cap)
+    return df.style.apply(lambda _: styles, axis=None).format("{:.0f}")
 
-    def _style_cell(value: object) -> str:
-        if pd.isna(value):
-            return ""
-        try:
-            count = int(value)
-        except (TypeError, ValueError):
-            return ""
-        if count <= 0:
-            return ""
-        intensity = min(count, heat_cap) / heat_cap
-        return f"background-color: rgba(255, 140, 0, {intensity:.2f});"
 
-    return df.style.map(_style_cell).format("{:.0f}")
+def _build_lensed_proc_frame(
+        lens: Lens | None,
+        battle_df: pd.DataFrame,
+) -> tuple[pd.DataFrame, list[str]]:
+    """Return the battle frame with required columns normalized and the lens applied."""
+    display_df = battle_df.copy()
+    display_df.attrs = {}
+    display_df, missing_columns = _normalize_required_columns(display_df)
+    if missing_columns:
+        return display_df, missing_columns
+    display_df = apply_combat_lens(display_df, lens, skip_target_filter_for_procs=True)
+    return display_df, missing_columns
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _lensed_proc_frame(
+        source_key: str,
+        lens: Lens | None,
+        _battle_df: pd.DataFrame,
+) -> tuple[pd.DataFrame, list[str]]:
+    """
+    Cached _build_lensed_proc_frame, keyed by the uploaded log's content hash and the lens.
+
+    The battle frame itself is not hashed (leading underscore); the upload hash identifies it.
+    """
+    return _build_lensed_proc_frame(lens, _battle_df)
 
 
 class ProcReportBase(AttackerAndTargetReport):
@@ -227,19 +323,17 @@ class ProcReportBase(AttackerAndTargetReport):
 
 
     def get_derived_dataframes(self, df: pd.DataFrame, lens) -> Optional[list[pd.DataFrame]]:
-        display_df = df.copy()
-        display_df.attrs = {}
-        display_df, missing_columns = _normalize_required_columns(display_df)
+        upload_hash = st.session_state.get("battle_upload_hash")
+        if isinstance(upload_hash, str):
+            display_df, missing_columns = _lensed_proc_frame(upload_hash, lens, df)
+        else:
+            logger.warning("No upload hash for battle data; applying the proc lens uncached.")
+            display_df, missing_columns = _build_lensed_proc_frame(lens, df)
 
         if missing_columns:
             st.warning(f"Missing required columns: {', '.join(missing_columns)}")
             return None
 
-        display_df = self.apply_combat_lens(
-            display_df,
-            lens,
-            skip_target_filter_for_procs=True,
-        )
         _debug_proc_counts("display_df after lens", display_df)
         return [display_df]
 
@@ -250,14 +344,13 @@ class ProcReportBase(AttackerAndTargetReport):
             self,
             display_df: pd.DataFrame,
     ) -> tuple[pd.DataFrame, tuple[str, ...]] | None:
-        proc_df = _get_proc_df(display_df, self.include_forbidden_tech)
+        proc_df, owner_options = _proc_df_and_owners(display_df, self.include_forbidden_tech)
         if proc_df.empty:
             st.info("No officer/tech proc rows found for this battle.")
             return None
 
-        owner_options = sorted(proc_df["owner"].dropna().unique().tolist())
         if not owner_options:
             logger.warning("Proc rows found without owner values.")
             st.info("No officer/tech proc owners found for this battle.")
             return None
-        return proc_df, tuple(owner_options)
\ No newline at end of file
+        return proc_df, owner_options
\ No newline at end of file
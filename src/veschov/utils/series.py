@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 
 def coerce_numeric(series: pd.Series) -> pd.Series:
     """Coerce a series of strings/numbers to numeric values."""
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        # Parsed combat columns are already numeric; skip the string round-trip, which
+        # dominates report render time. Nullable dtypes become float64 with NaN, matching
+        # what the string path produced for missing values.
+        if isinstance(series.dtype, np.dtype):
+            return series.copy()
+        return series.astype("float64")
     cleaned = series.astype(str).str.replace(",", "", regex=False).str.strip()
     return pd.to_numeric(cleaned, errors="coerce")
@@ -1,8 +1,23 @@
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 sys.path.insert(0, str(SRC))
+
+# Run the full pandera checks in tests; the app only coerces dtypes by default.
+os.environ.setdefault("VESCHOV_VALIDATE_SCHEMAS", "1")
+# Always exercise the parser rather than the on-disk parse cache.
+os.environ.setdefault("VESCHOV_PARSE_CACHE_DIR", "")
+
+
+@pytest.fixture(params=["1", "0"], ids=["full-validation", "coerce-only"])
+def validation_mode(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    """Run a test with full pandera validation and with the production coerce-only path."""
+    monkeypatch.setenv("VESCHOV_VALIDATE_SCHEMAS", request.param)
+    return request.param == "1"
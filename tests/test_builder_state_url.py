@@ -0,0 +1,111 @@
+"""Round-trip tests for the builder share-URL state encoding."""
+
+from __future__ import annotations
+
+import base64
+import json
+import lzma
+import types
+import zlib
+
+import pytest
+
+from veschov.builder import CopyUrlButtons
+from veschov.builder.Constants import PRESET_DEFLATE_PREFIX, RAW_PREFIX, STATE_VERSION
+
+
+class _SessionState(dict):
+    """Dict with attribute access, standing in for st.session_state."""
+
+    def __getattr__(self, name: str) -> object:
+        try:
+            return self[name]
+        except KeyError as exc:
+            raise AttributeError(name) from exc
+
+    def __setattr__(self, name: str, value: object) -> None:
+        self[name] = value
+
+
+EMPTY_STATE = {
+    "v": STATE_VERSION,
+    "holding": None,
+    "bridge_slots": [None, None, None],
+    "even_slots": [None] * 7,
+    "manual_pick": "—",
+    "build_name": "",
+    "ship_name": "",
+    "notes": "",
+    "suggestions": [],
+}
+FULL_STATE = {
+    **EMPTY_STATE,
+    "holding": "Spock",
+    "bridge_slots": ["Kirk", "Spock", None],
+    "even_slots": ["Uhura", None, "Scotty", None, None, "Sulu", None],
+    "build_name": "Hostile grind",
+    "ship_name": "Enterprise",
+    "notes": "Crit build — swap Uhura for armadas. " * 20,
+    "suggestions": ["Chekov", "McCoy"],
+}
+
+
+def _json_bytes(state: dict[str, object]) -> bytes:
+    return json.dumps(state, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _unpadded(value: str) -> str:
+    return value.rstrip("=")
+
+
+@pytest.fixture
+def session_state(monkeypatch: pytest.MonkeyPatch) -> _SessionState:
+    state = _SessionState()
+    monkeypatch.setattr(CopyUrlButtons, "st", types.SimpleNamespace(session_state=state))
+    return state
+
+
+@pytest.mark.parametrize("state", [EMPTY_STATE, FULL_STATE], ids=["empty", "full"])
+def test_serialize_state_round_trips(
+    session_state: _SessionState, state: dict[str, object]
+) -> None:
+    session_state.update(state)
+    session_state["suggestions"] = dict.fromkeys(state["suggestions"])
+
+    encoded = CopyUrlButtons.serialize_state()
+
+    assert encoded.startswith((PRESET_DEFLATE_PREFIX, RAW_PREFIX))
+    assert "=" not in encoded
+    assert CopyUrlButtons.deserialize_state(encoded) == state
+    assert CopyUrlButtons.serialize_state() == encoded
+
+
+def _raw(state: dict[str, object]) -> str:
+    return RAW_PREFIX + base64.urlsafe_b64encode(_json_bytes(state)).decode("ascii")
+
+
+def _lzma(state: dict[str, object]) -> str:
+    compressed = lzma.compress(_json_bytes(state), preset=9)
+    return "x:" + base64.urlsafe_b64encode(compressed).decode("ascii")
+
+
+def _legacy_zlib(state: dict[str, object]) -> str:
+    return base64.urlsafe_b64encode(zlib.compress(_json_bytes(state))).decode("ascii")
+
+
+@pytest.mark.parametrize("encoder", [_raw, _lzma, _legacy_zlib], ids=["raw", "lzma", "zlib"])
+@pytest.mark.parametrize("strip_padding", [False, True], ids=["padded", "unpadded"])
+@pytest.mark.parametrize("state", [EMPTY_STATE, FULL_STATE], ids=["empty", "full"])
+def test_deserialize_state_accepts_all_link_formats(
+    encoder, strip_padding: bool, state: dict[str, object]
+) -> None:
+    encoded = encoder(state)
+    if strip_padding:
+        encoded = _unpadded(encoded)
+
+    assert CopyUrlButtons.deserialize_state(encoded) == state
+
+
+@pytest.mark.parametrize("encoded", ["", "p:not-base64!", "x:AAAA", "r:e30", "d:AAAA"])
+def test_deserialize_state_rejects_invalid_payloads(encoded: str) -> None:
+    assert CopyUrlButtons.deserialize_state(encoded) is None
@@ -0,0 +1,44 @@
+"""Tests for combat log column resolution."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from veschov.transforms.columns import (
+    ATTACKER_COLUMN_CANDIDATES,
+    RESOLVED_COLUMNS_ATTR,
+    TARGET_COLUMN_CANDIDATES,
+    record_actor_columns,
+    resolve_actor_columns,
+    resolve_column,
+)
+
+
+@pytest.mark.parametrize(
+    "columns",
+    [
+        [],
+        ["round", "event_type"],
+        ["Attacker", "attacker_name", "Target"],
+        ["Defender Name", "Target", "Attacker"],
+        ["target_name", "Defender Name"],
+    ],
+)
+def test_resolve_actor_columns_matches_resolve_column(columns: list[str]) -> None:
+    df = pd.DataFrame(columns=columns)
+
+    assert resolve_actor_columns(df) == (
+        resolve_column(df, ATTACKER_COLUMN_CANDIDATES),
+        resolve_column(df, TARGET_COLUMN_CANDIDATES),
+    )
+
+
+def test_resolve_actor_columns_uses_recorded_names_until_stale() -> None:
+    df = pd.DataFrame(columns=["Attacker", "Target"])
+    record_actor_columns(df)
+    assert df.attrs[RESOLVED_COLUMNS_ATTR] == ("Attacker", "Target")
+
+    renamed = df.rename(columns={"Target": "target_name"})
+
+    assert resolve_actor_columns(renamed) == ("Attacker", "target_name")
@@ -0,0 +1,49 @@
+"""Tests for crit chance trend plot downsampling."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from veschov.ui.object_reports.CritChanceTrendsReport import (
+    DOWNSAMPLE_MAX_POINTS,
+    _downsample_shot_view,
+    _m4_indices,
+)
+
+
+@pytest.mark.parametrize(("length", "buckets"), [(5, 10), (100, 7), (10_000, 1500)])
+def test_m4_indices_keep_bucket_extremes(length: int, buckets: int) -> None:
+    rng = np.random.default_rng(0)
+    values = rng.random(length)
+
+    keep = _m4_indices(length, buckets, values)
+
+    assert keep[0] == 0
+    assert keep[-1] == length - 1
+    assert np.all(np.diff(keep) > 0)
+    assert values.argmin() in keep
+    assert values.argmax() in keep
+    assert keep.size <= 4 * min(length, buckets)
+
+
+@pytest.mark.parametrize("length", [100, 6001, 9000, 12_000, 50_000])
+def test_downsample_shot_view_stays_within_point_budget(length: int) -> None:
+    rng = np.random.default_rng(0)
+    shot_view_df = pd.DataFrame(
+        {
+            "shot_index_global": np.arange(length),
+            "crit_chance": rng.random(length),
+            "smoothed": rng.random(length),
+        }
+    )
+
+    result = _downsample_shot_view(shot_view_df)
+
+    assert len(result) <= DOWNSAMPLE_MAX_POINTS
+    if length <= DOWNSAMPLE_MAX_POINTS:
+        assert result is shot_view_df
+    assert result["shot_index_global"].is_monotonic_increasing
+    assert result.index[0] == 0
+    assert result.index[-1] == length - 1
@@ -0,0 +1,26 @@
+"""Tests for large-number formatting."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from veschov.ui.components.number_format import format_number, format_number_series
+
+
+@pytest.mark.parametrize("number_format", ["Human", "Exact"])
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series([], dtype="float64"),
+        pd.Series([0.0, 12.5, 1_000.0, 2_500_000.0, -3_000_000.0, np.nan, 12.5]),
+        pd.Series([1, 999_999, 1_000_000], dtype="int64"),
+        pd.Series([5, pd.NA, 7_000_000], dtype="Int64"),
+        pd.Series(["1,000", None, "text"], dtype=object),
+    ],
+)
+def test_format_number_series_matches_scalar(series: pd.Series, number_format: str) -> None:
+    expected = [format_number(value, number_format=number_format) for value in series]
+
+    assert format_number_series(series, number_format=number_format).tolist() == expected
@@ -0,0 +1,36 @@
+"""Tests for parallel batch parsing of battle logs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+from tests import helpers
+from veschov.io.parser_stub import parse_battle_logs
+
+LOG_NAMES = ["1.csv", "2-outpost-retal.csv", "3-armada.csv"]
+
+
+def test_parse_battle_logs_matches_sequential_parse() -> None:
+    log_dir = Path(helpers.__file__).resolve().parent / "logs"
+    paths = [log_dir / name for name in LOG_NAMES]
+
+    parsed = list(parse_battle_logs(paths, max_workers=2))
+
+    assert len(parsed) == len(LOG_NAMES)
+    for name, df in zip(LOG_NAMES, parsed):
+        expected = helpers.get_battle_log(name)
+        pd.testing.assert_frame_equal(df, expected)
+        assert set(df.attrs) == set(expected.attrs)
+
+
+def test_parse_battle_logs_with_small_window_keeps_order() -> None:
+    log_dir = Path(helpers.__file__).resolve().parent / "logs"
+    paths = [log_dir / name for name in LOG_NAMES * 2]
+
+    parsed = list(parse_battle_logs(paths, max_workers=2, max_in_flight=2))
+
+    assert len(parsed) == len(paths)
+    for path, df in zip(paths, parsed):
+        pd.testing.assert_frame_equal(df, helpers.get_battle_log(path.name))
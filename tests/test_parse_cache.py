@@ -0,0 +1,64 @@
+"""Tests for the on-disk parse cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from tests import helpers
+from veschov.io import parse_cache, parser_stub
+from veschov.io.parser_stub import parse_battle_log
+
+
+def test_cached_parse_round_trips(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(parse_cache.PARSE_CACHE_ENV_VAR, str(tmp_path))
+    file_bytes = (Path(helpers.__file__).resolve().parent / "logs" / "1.csv").read_bytes()
+
+    parsed = parse_battle_log(file_bytes, "1.csv")
+    key = parse_cache.content_key(file_bytes)
+    assert parse_cache.load_cached_parse(key) is not None
+
+    def fail_parse(*args: object, **kwargs: object) -> None:
+        raise AssertionError("expected a parse cache hit")
+
+    monkeypatch.setattr(parser_stub, "read_text", fail_parse)
+    cached = parse_battle_log(file_bytes, "1.csv")
+
+    pd.testing.assert_frame_equal(cached, parsed)
+    assert cached["event_type"].dtype == parsed["event_type"].dtype
+    parsed_frames = {
+        name: frame for name, frame in parsed.attrs.items() if isinstance(frame, pd.DataFrame)
+    }
+    cached_frames = {
+        name for name, frame in cached.attrs.items() if isinstance(frame, pd.DataFrame)
+    }
+    assert cached_frames == set(parsed_frames)
+    for name, frame in parsed_frames.items():
+        pd.testing.assert_frame_equal(
+            cached.attrs[name], frame.reset_index(drop=True), check_dtype=False
+        )
+    for name in ("players_df", "loot_df"):
+        assert cached.attrs[name].dtypes.to_dict() == parsed_frames[name].dtypes.to_dict()
+
+
+def test_cache_disabled_by_empty_dir(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(parse_cache.PARSE_CACHE_ENV_VAR, "")
+    assert parse_cache.parse_cache_dir() is None
+    assert parse_cache.load_cached_parse("missing") is None
+
+
+def test_cache_disabled_when_unset(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(parse_cache.PARSE_CACHE_ENV_VAR, raising=False)
+    assert parse_cache.parse_cache_dir() is None
+
+
+def test_store_leaves_no_temp_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(parse_cache.PARSE_CACHE_ENV_VAR, str(tmp_path))
+    parse_cache.store_cached_parse("key", pd.DataFrame({"a": [1, 2]}))
+    parse_cache.store_cached_parse("key", pd.DataFrame({"a": [1, 2]}))
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        f"key.{parse_cache.COMBAT_FILE_SUFFIX}"
+    ]
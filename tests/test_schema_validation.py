@@ -0,0 +1,54 @@
+"""Tests for schema validation helpers."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from veschov.io.schemas import LootSchema, to_arrow_strings
+from veschov.io.schemas.LootSchema import LOOT_STRING_COLUMNS
+from veschov.io.schemas.SchemaValidation import _coerce_to_schema, reorder_columns
+
+pytestmark = pytest.mark.usefixtures("validation_mode")
+
+
+@pytest.mark.parametrize(
+    ("columns", "order", "expected"),
+    [
+        (["a", "b", "c"], ["a", "b"], ["a", "b", "c"]),
+        (["c", "a", "b"], ["a", "b"], ["a", "b", "c"]),
+        (["a", "a", "b"], ["b"], ["b", "a", "a"]),
+        (["a", "b", "a"], ["a", "missing"], ["a", "a", "b"]),
+    ],
+)
+def test_reorder_columns(columns: list[str], order: list[str], expected: list[str]) -> None:
+    df = pd.DataFrame([list(range(len(columns)))], columns=columns)
+    df.attrs["source"] = "test"
+
+    result = reorder_columns(df, order)
+
+    assert list(result.columns) == expected
+    assert sorted(result.iloc[0].tolist()) == list(range(len(columns)))
+    assert result.attrs == {"source": "test"}
+
+
+def test_coerce_to_schema_keeps_matching_and_arrow_string_columns() -> None:
+    df = to_arrow_strings(
+        pd.DataFrame({"Reward Name": ["Ore", None], "Count": [1.0, 2.0]}),
+        LOOT_STRING_COLUMNS,
+    )
+
+    result = _coerce_to_schema(df, LootSchema)
+
+    assert result is df
+    assert result["Reward Name"].dtype == df["Reward Name"].dtype
+
+
+def test_coerce_to_schema_coerces_stale_columns_only() -> None:
+    df = pd.DataFrame({"Reward Name": ["Ore"], "Count": [3]})
+
+    result = _coerce_to_schema(df, LootSchema)
+
+    assert result["Count"].dtype == "float64"
+    assert result["Reward Name"].dtype == df["Reward Name"].dtype
+
@@ -0,0 +1,41 @@
+"""Tests for shot_index derivation."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from veschov.transforms.derive_metrics import _cumcount, add_shot_index
+
+
+@pytest.mark.parametrize(
+    "codes",
+    [
+        [],
+        [0],
+        [2, 1, 2, 2, 1],
+        [0, 0, 0],
+        [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5],
+    ],
+)
+def test_cumcount_matches_groupby(codes: list[int]) -> None:
+    array = np.asarray(codes, dtype=np.int64)
+    expected = pd.Series(array).groupby(array).cumcount().to_numpy()
+    np.testing.assert_array_equal(_cumcount(array), expected)
+
+
+def test_add_shot_index_counts_per_attacker_target_pair() -> None:
+    df = pd.DataFrame(
+        {
+            "event_type": ["Attack", " attack ", "Officer", "ATTACK", "Attack", None],
+            "attacker_name": ["A", "A", "A", "B", "A", "A"],
+            "target_name": ["X", "X", "X", "X", None, "X"],
+            "total_normal": [10.0, 5.0, 0.0, 7.0, 3.0, 9.0],
+        }
+    )
+
+    result = add_shot_index(df)
+
+    assert result["shot_index"].tolist() == [1, 2, pd.NA, 1, 1, pd.NA]
+    assert "shot_index" not in df.columns
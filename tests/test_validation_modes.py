@@ -0,0 +1,75 @@
+"""Tests for parser output with and without full pandera validation."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from tests import helpers
+from veschov.io.schemas import CombatSchema, FleetsSchema, LootSchema, PlayersSchema
+from veschov.io.schemas.CombatSchema import COMBAT_STRING_COLUMNS
+from veschov.io.schemas.SchemaValidation import (
+    SCHEMA_VALIDATION_ENV_VAR,
+    _compiled_schema,
+    _dtype_matches,
+)
+from veschov.io.schemas.schema_helpers import arrow_string_dtype
+
+LOG_NAMES = ["1.csv", "2-outpost-retal.csv", "3-armada.csv", "4-partial.csv", "5-kren.csv"]
+ATTR_SCHEMAS = {
+    "players_df": PlayersSchema,
+    "fleets_df": FleetsSchema,
+    "loot_df": LootSchema,
+}
+
+
+def _assert_matches_schema(df: pd.DataFrame, schema: type) -> None:
+    mismatched = {
+        name: str(df[name].dtype)
+        for name, column in _compiled_schema(schema).columns.items()
+        if name in df.columns and not _dtype_matches(df[name], column)
+    }
+    assert not mismatched, f"{schema.__name__} columns with unexpected dtypes: {mismatched}"
+
+
+@pytest.mark.parametrize("log_name", LOG_NAMES)
+def test_parsed_dtypes_match_schemas(log_name: str, validation_mode: bool) -> None:
+    df = helpers.get_battle_log(log_name)
+
+    _assert_matches_schema(df, CombatSchema)
+    for name, schema in ATTR_SCHEMAS.items():
+        _assert_matches_schema(df.attrs[name], schema)
+    string_dtype = arrow_string_dtype()
+    if string_dtype is not None:
+        for column in COMBAT_STRING_COLUMNS:
+            if column in df.columns:
+                assert df[column].dtype == string_dtype, column
+
+
+@pytest.mark.parametrize("log_name", LOG_NAMES)
+def test_coerce_only_dtypes_match_full_validation(
+    log_name: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(SCHEMA_VALIDATION_ENV_VAR, "1")
+    validated = helpers.get_battle_log(log_name)
+    monkeypatch.setenv(SCHEMA_VALIDATION_ENV_VAR, "0")
+    coerced = helpers.get_battle_log(log_name)
+
+    assert list(coerced.columns) == list(validated.columns)
+    assert coerced.dtypes.to_dict() == validated.dtypes.to_dict()
+    for name in ATTR_SCHEMAS:
+        assert coerced.attrs[name].dtypes.to_dict() == validated.attrs[name].dtypes.to_dict()
+
+
+@pytest.mark.parametrize("log_name", LOG_NAMES)
+def test_default_mode_coerces_dtypes(log_name: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    # The production default: no override, so only dtype coercion runs.
+    monkeypatch.delenv(SCHEMA_VALIDATION_ENV_VAR, raising=False)
+    df = helpers.get_battle_log(log_name)
+
+    assert df["round"].dtype == "int64"
+    assert df["battle_event"].dtype == "int64"
+    assert df.attrs["players_df"]["Player Level"].dtype == pd.Int16Dtype()
+    _assert_matches_schema(df, CombatSchema)
+    for name, schema in ATTR_SCHEMAS.items():
+        _assert_matches_schema(df.attrs[name], schema)